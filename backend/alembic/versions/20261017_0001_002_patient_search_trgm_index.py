@@ -0,0 +1,31 @@
+"""Trigram index for patient free-text search.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+
+Backs the ILIKE '%term%' search in PatientService.search_patients, which
+cannot use a btree index, with a pg_trgm GIN index on the concatenated
+MRN, names and email (app.models.database.PATIENT_SEARCH_TEXT).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_patients_search_trgm ON patients USING gin "
+        "((mrn || ' ' || given_name || ' ' || family_name || ' ' || coalesce(email, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_patients_search_trgm', table_name='patients')
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from fastapi.responses import Response
 from typing import Optional
-import asyncio
+import json
 
 from app.core.logging import get_logger
 from app.core.config import get_settings
@@ -133,18 +133,24 @@ async def get_slice(
         file_data = await storage_service.download_file(settings.GCS_BUCKET_NAME, file_id)
         filename = get_filename_from_path(file_id)
 
-        # Get slice
-        result = imaging_service.get_slice_with_window(
+        # Hash the file once: the slice and its prefetches share the cache keys
+        source = imaging_service.slice_source(
             file_data=file_data,
             filename=filename,
-            slice_index=slice_index,
             window_center=window_center,
             window_width=window_width
         )
 
+        # Get slice
+        result, cache_hit = await imaging_service.get_slice_from_source(source, slice_index)
+
         # FASE 1: Intelligent Prefetching (fire-and-forget)
         # Prefetch next N slices in background based on navigation direction
         if settings.ENABLE_PREFETCHING:
+            # A prefetched slice that missed was evicted before use: shrink
+            # this file's prefetch window before scheduling the next batch
+            prefetch_service.report_access(file_id, slice_index, cache_hit)
+
             # Get total slices from metadata
             img_format = imaging_service.detect_format(file_data, filename)
             if img_format.value == "dicom":
@@ -157,13 +163,12 @@ async def get_slice(
             total_slices = metadata.get('slices', 0)
 
             # Fire-and-forget prefetching (don't await)
-            asyncio.create_task(
-                prefetch_service.prefetch_slices(
-                    file_id=file_id,
-                    current_slice=slice_index,
-                    total_slices=total_slices,
-                    direction=direction
-                )
+            prefetch_service.schedule_prefetch_slices(
+                file_id=file_id,
+                source=source,
+                current_slice=slice_index,
+                total_slices=total_slices,
+                direction=direction
             )
 
             logger.debug(
@@ -299,6 +304,7 @@ async def get_voxel_3d_visualization(
 
 @router.get("/matplotlib-2d/{file_id:path}/{slice_index}")
 async def get_matplotlib_2d_slice(
+    request: Request,
     file_id: str,
     slice_index: int,
     window_center: Optional[float] = Query(None, description="Window center for contrast adjustment"),
@@ -310,12 +316,14 @@ async def get_matplotlib_2d_slice(
     y_max: Optional[int] = Query(None, ge=0, description="Y-axis upper limit (pixels)"),
     minimal: bool = Query(False, description="If True, renders only image data without axes/labels/colorbar for segmentation overlay"),
     segmentation_id: Optional[str] = Query(None, description="If provided, overlay segmentation on the matplotlib image"),
+    dpi: int = Query(72, ge=36, le=300, description="Figure resolution; raise it (e.g. 150) for exports. Ignored when minimal"),
     storage_service: IStorageService = Depends(get_storage_service),
     imaging_service: IImagingService = Depends(get_imaging_service)
 ):
     """
     Generate a 2D slice visualization using matplotlib with colormap and axis limits support.
-    Returns a base64 encoded PNG image.
+    Returns a base64 encoded PNG image. Clients sending `Accept: image/png` receive the PNG
+    bytes directly instead, with the bbox (if any) JSON-encoded in the `X-Image-Bbox` header.
 
     When minimal=True, the output image contains only the pixel data without any decorative elements,
     ensuring perfect voxel coordinate alignment for segmentation overlay.
@@ -349,8 +357,7 @@ async def get_matplotlib_2d_slice(
         file_data = await storage_service.download_file(settings.GCS_BUCKET_NAME, file_id)
         filename = get_filename_from_path(file_id)
 
-        # Generate 2D matplotlib visualization
-        result = await imaging_service.generate_2d_matplotlib_slice(
+        render_kwargs = dict(
             file_data=file_data,
             filename=filename,
             slice_index=slice_index,
@@ -362,9 +369,22 @@ async def get_matplotlib_2d_slice(
             y_min=y_min,
             y_max=y_max,
             minimal=minimal,
-            segmentation_id=segmentation_id
+            segmentation_id=segmentation_id,
+            dpi=dpi
         )
 
+        # Binary response: ~25% fewer bytes than base64-in-JSON and no
+        # base64 encode/decode on either side
+        if "image/png" in request.headers.get("accept", ""):
+            png_bytes, image_bbox = await imaging_service.render_2d_matplotlib_slice_png(**render_kwargs)
+            headers = {"Access-Control-Expose-Headers": "X-Image-Bbox"}
+            if image_bbox is not None:
+                headers["X-Image-Bbox"] = json.dumps(image_bbox)
+            return Response(content=png_bytes, media_type="image/png", headers=headers)
+
+        # Generate 2D matplotlib visualization
+        result = await imaging_service.generate_2d_matplotlib_slice(**render_kwargs)
+
         return result
 
     except Exception as e:
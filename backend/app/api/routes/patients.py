@@ -6,14 +6,14 @@ HL7 FHIR-aligned REST API endpoints for patient management.
 @module api.routes.patients
 """
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Path, status
+from fastapi import APIRouter, Body, Depends, Query, Path, status
 
 from app.core.container import get_patient_service
 from app.core.logging import get_logger
-from app.services.patient_service_firestore import PatientServiceFirestore
+from app.services.patient_service_firestore import MAX_BULK_HISTORY_ITEMS, PatientServiceFirestore
 from app.models.patient_schemas import (
     PatientCreate,
     PatientUpdate,
@@ -31,6 +31,13 @@ router = APIRouter(prefix="/patients", tags=["Patients"])
 logger = get_logger(__name__)
 
 
+def _next_cursor(patients: List[PatientSummary], page_size: int) -> Optional[str]:
+    """Cursor for the page after a full one: the ID of its last patient."""
+    if len(patients) < page_size:
+        return None
+    return str(patients[-1].id)
+
+
 # ============================================================================
 # PATIENT CRUD ENDPOINTS
 # ============================================================================
@@ -68,17 +75,22 @@ async def list_patients(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[PatientStatus] = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (instead of page)"),
     service: PatientServiceFirestore = Depends(get_patient_service)
 ):
     """
     List all patients with pagination.
 
     Required permissions: PATIENT_VIEW
+
+    Deep pages are cheaper to fetch by passing the previous response's
+    next_cursor than by page number.
     """
     patients, total = await service.list_patients(
         page=page,
         page_size=page_size,
-        status=status.value if status else None
+        status=status.value if status else None,
+        cursor=cursor
     )
 
     total_pages = (total + page_size - 1) // page_size
@@ -88,7 +100,8 @@ async def list_patients(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=_next_cursor(patients, page_size)
     )
 
 
@@ -110,6 +123,7 @@ async def search_patients(
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("family_name", description="Sort field"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (instead of page)"),
     service: PatientServiceFirestore = Depends(get_patient_service)
 ):
     """
@@ -130,7 +144,8 @@ async def search_patients(
         page=page,
         page_size=page_size,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor
     )
 
     patients, total = await service.search_patients(search)
@@ -141,7 +156,8 @@ async def search_patients(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=_next_cursor(patients, page_size)
     )
 
 
@@ -266,6 +282,31 @@ async def add_medical_history(
     return history
 
 
+@router.post(
+    "/{patient_id}/history/bulk",
+    response_model=list[MedicalHistoryResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Add medical history entries in bulk",
+    description="Add several medical conditions to patient's history in one request."
+)
+async def add_medical_history_bulk(
+    patient_id: UUID = Path(..., description="Patient UUID"),
+    items: List[MedicalHistoryCreate] = Body(..., max_length=MAX_BULK_HISTORY_ITEMS),
+    service: PatientServiceFirestore = Depends(get_patient_service)
+):
+    """
+    Add several medical history entries.
+
+    Required permissions: PATIENT_UPDATE (or RADIOLOGIST role)
+
+    Used when importing a patient's history; entries are written in batches.
+    Accepts at most 2000 entries. Not atomic: when a batch
+    fails the request errors, but other batches may already be written.
+    """
+    history = await service.add_medical_history_bulk(patient_id, items)
+    return history
+
+
 @router.get(
     "/{patient_id}/history",
     response_model=list[MedicalHistoryResponse],
@@ -21,6 +21,7 @@ from app.core.interfaces.storage_interface import IStorageService
 from app.core.container import get_segmentation_service, get_imaging_service, get_storage_service
 from app.services.segmentation_service import SegmentationService
 from app.core.config import get_settings
+from app.utils import ensure_3d_array
 
 settings = get_settings()
 
@@ -310,12 +311,8 @@ async def get_overlay_image(
                     detail=f"Unsupported format: {img_format}"
                 )
 
-            # Ensure 3D
-            if len(pixel_array.shape) == 2:
-                pixel_array = pixel_array[:, :, np.newaxis]
-
             # Get slice
-            base_image = pixel_array[:, :, slice_index]
+            base_image = ensure_3d_array(pixel_array)[:, :, slice_index]
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -565,7 +562,7 @@ async def get_segmentation_nifti(
     """
     try:
         # Get the segmentation NIfTI from GCS
-        nifti_data = segmentation_service.get_segmentation_nifti(segmentation_id)
+        nifti_data = await segmentation_service.get_segmentation_nifti(segmentation_id)
 
         if nifti_data is None:
             raise HTTPException(
@@ -152,6 +152,9 @@ class Settings(BaseSettings):
     CACHE_METADATA_TTL: int = Field(default=600, ge=60, le=3600)
     CACHE_DEFAULT_TTL: int = Field(default=3600, ge=300, le=86400)
 
+    # In-process cache of decoded image arrays (0 disables)
+    IMAGING_ARRAY_CACHE_MAX_BYTES: int = Field(default=536_870_912, ge=0)  # 512MB
+
     # Logging (ISO 27001 A.12.4.1)
     LOG_LEVEL: str = Field(default="INFO")
     LOG_FORMAT: str = Field(default="json")
@@ -177,6 +180,11 @@ class Settings(BaseSettings):
     ENABLE_PREFETCHING: bool = Field(default=True)
     PREFETCH_SLICES: int = Field(default=3, ge=1, le=10)
     PREFETCH_PRIORITY: str = Field(default="normal")
+    PREFETCH_MAX_CONCURRENCY: int = Field(default=8, ge=1, le=128)
+
+    # Delay before paint strokes are flushed to Firestore/GCS; strokes within
+    # the window are saved together
+    SEG_FLUSH_DEBOUNCE_MS: int = Field(default=500, ge=0, le=10000)
 
     USE_REDIS_SCAN: bool = Field(default=True)
     REDIS_SCAN_COUNT: int = Field(default=100, ge=10, le=1000)
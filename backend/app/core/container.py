@@ -255,7 +255,7 @@ def get_prefetch_service():
             prefetch_service = Depends(get_prefetch_service)
         ):
             # Get slice and prefetch next ones
-            await prefetch_service.prefetch_slices(file_id, slice_index, total_slices)
+            await prefetch_service.prefetch_slices(file_id, source, slice_index, total_slices)
     """
     container = get_container()
     return container.prefetch_service()
@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker
 )
+from sqlalchemy import text
 from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
@@ -172,6 +173,8 @@ async def init_db() -> None:
     """
     engine = get_engine()
     async with engine.begin() as conn:
+        # ix_patients_search_trgm uses the gin_trgm_ops operator class
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables initialized")
 
@@ -137,6 +137,22 @@ class ICacheService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """
+        Check which of several keys exist, in one round trip.
+
+        Args:
+            keys: List of cache keys
+
+        Returns:
+            Existence flags in the same order as keys
+
+        Raises:
+            CacheException: If cache operation fails
+        """
+        pass
+
     @abstractmethod
     async def get_many(self, keys: List[str]) -> dict[str, Any]:
         """
@@ -157,7 +173,8 @@ class ICacheService(ABC):
     async def set_many(
         self,
         items: dict[str, Any],
-        ttl: Optional[timedelta] = None
+        ttl: Optional[timedelta] = None,
+        nx: bool = False
     ) -> bool:
         """
         Set multiple values at once.
@@ -165,6 +182,7 @@ class ICacheService(ABC):
         Args:
             items: Dictionary mapping keys to values
             ttl: Time to live for all items (None = no expiration)
+            nx: Only set keys that do not already exist
 
         Returns:
             True if all items were cached successfully
@@ -5,7 +5,7 @@ Patient service interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 from uuid import UUID
 
 from app.models.patient_schemas import (
@@ -71,6 +71,22 @@ class IPatientService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_patients_bulk(
+        self,
+        patient_ids: List[UUID]
+    ) -> Dict[UUID, PatientResponse]:
+        """
+        Get several patients by ID in one read.
+
+        Args:
+            patient_ids: Patient UUIDs
+
+        Returns:
+            Patient records keyed by ID; unknown IDs are omitted
+        """
+        pass
+
     @abstractmethod
     async def get_patient_by_mrn(
         self,
@@ -153,7 +169,8 @@ class IPatientService(ABC):
         self,
         page: int = 1,
         page_size: int = 20,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> Tuple[List[PatientSummary], int]:
         """
         List all patients with pagination.
@@ -162,6 +179,8 @@ class IPatientService(ABC):
             page: Page number
             page_size: Items per page
             status: Optional status filter
+            cursor: Resume after the last patient of the previous page
+                (its ID); takes precedence over page
 
         Returns:
             Tuple of (patient list, total count)
@@ -193,6 +212,29 @@ class IPatientService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def add_medical_history_bulk(
+        self,
+        patient_id: UUID,
+        items: List[MedicalHistoryCreate],
+        recorded_by: Optional[str] = None
+    ) -> List[MedicalHistoryResponse]:
+        """
+        Add several medical history entries for a patient in one write.
+
+        Args:
+            patient_id: Patient UUID
+            items: Medical history entries
+            recorded_by: Name of recording clinician
+
+        Returns:
+            Created medical history entries, in input order
+
+        Raises:
+            NotFoundException: If patient not found
+        """
+        pass
+
     @abstractmethod
     async def get_medical_history(
         self,
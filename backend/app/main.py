@@ -107,6 +107,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: gracefully handle shutdown
     logger.info("Application shutdown initiated - waiting for pending tasks")
+    from app.services.prefetch_service import wait_for_prefetches
+    await wait_for_prefetches()
+    # Segmentation service is imported lazily; only flush if it was loaded
+    segmentation_module = sys.modules.get("app.services.segmentation_service")
+    if segmentation_module is not None:
+        await segmentation_module.wait_for_pending_flushes()
     await asyncio.sleep(0.1)
     logger.info("Application shutdown complete")
 
@@ -17,7 +17,8 @@ from enum import Enum as PyEnum
 
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, Text, Date, DateTime,
-    ForeignKey, Enum, JSON, LargeBinary, BigInteger, Index, CheckConstraint
+    ForeignKey, Enum, JSON, LargeBinary, BigInteger, Index, CheckConstraint,
+    literal_column
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, DeclarativeBase, Mapped, mapped_column
@@ -231,6 +232,23 @@ class Patient(Base):
         )
 
 
+# Free-text search target for PatientService.search_patients. Built with ||
+# (IMMUTABLE, unlike concat_ws) and literal separators so that queries match
+# the expression of the pg_trgm GIN index below, which serves ILIKE '%term%'.
+_SPACE = literal_column("' '")
+PATIENT_SEARCH_TEXT = (
+    Patient.mrn + _SPACE + Patient.given_name + _SPACE + Patient.family_name
+    + _SPACE + func.coalesce(Patient.email, literal_column("''"))
+)
+
+Index(
+    'ix_patients_search_trgm',
+    PATIENT_SEARCH_TEXT.label('search_text'),
+    postgresql_using='gin',
+    postgresql_ops={'search_text': 'gin_trgm_ops'},
+)
+
+
 # ============================================================================
 # IMAGING STUDY MODEL (HL7 FHIR ImagingStudy Resource)
 # ============================================================================
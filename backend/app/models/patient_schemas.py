@@ -117,6 +117,8 @@ class PatientCreate(BaseModel):
         return v.upper()
 
     model_config = {
+        # Enums are stored as their values, so keep them as plain strings
+        "use_enum_values": True,
         "json_schema_extra": {
             "example": {
                 "mrn": "MRN-2025-001",
@@ -180,6 +182,10 @@ class PatientUpdate(BaseModel):
             raise ValueError('Deceased date cannot be in the future')
         return self
 
+    model_config = {
+        "use_enum_values": True
+    }
+
 
 class PatientSearch(BaseModel):
     """
@@ -197,11 +203,16 @@ class PatientSearch(BaseModel):
     # Pagination
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page; takes precedence over page")
 
     # Sorting
     sort_by: str = Field(default="family_name", description="Sort field")
     sort_order: str = Field(default="asc", pattern="^(asc|desc)$", description="Sort order")
 
+    model_config = {
+        "use_enum_values": True
+    }
+
 
 # ============================================================================
 # RESPONSE SCHEMAS
@@ -294,6 +305,7 @@ class PatientListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the following page
 
 
 # ============================================================================
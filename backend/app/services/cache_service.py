@@ -254,6 +254,29 @@ class RedisCacheService(ICacheService):
             )
             return False
 
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """Check which keys exist with one pipelined round trip."""
+        if not self._redis_available or not keys:
+            return [False] * len(keys)
+
+        try:
+            client = await self._get_client()
+
+            # Non-transactional pipeline: the EXISTS calls are independent
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.exists(key)
+                results = await pipe.execute()
+
+            return [bool(result) for result in results]
+
+        except Exception as e:
+            logger.warning(
+                "Cache exists_many check failed",
+                extra={"keys_count": len(keys), "error": str(e)}
+            )
+            return [False] * len(keys)
+
     async def clear_pattern(self, pattern: str) -> int:
         """
         Clear all keys matching a pattern.
@@ -405,32 +428,27 @@ class RedisCacheService(ICacheService):
     async def set_many(
         self,
         items: dict[str, Any],
-        ttl: Optional[timedelta] = None
+        ttl: Optional[timedelta] = None,
+        nx: bool = False
     ) -> bool:
-        """Set multiple values at once."""
+        """Set multiple values with one pipelined round trip."""
         if not self._redis_available or not items:
             return False
 
         try:
             client = await self._get_client()
+            ttl_seconds = int(ttl.total_seconds()) if ttl else None
 
-            # Serialize all values
-            serialized = {k: self._serialize(v) for k, v in items.items()}
-
-            # Use pipeline for atomic operation
-            async with client.pipeline() as pipe:
-                await pipe.mset(serialized)
-
-                # Set TTL for each key if specified
-                if ttl:
-                    for key in items.keys():
-                        await pipe.expire(key, int(ttl.total_seconds()))
-
+            # One SET per key carries its own expiry, so no EXPIRE follow-ups;
+            # the writes are independent, so no MULTI/EXEC either
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, self._serialize(value), ex=ttl_seconds, nx=nx)
                 await pipe.execute()
 
             logger.debug(
                 f"Cache set_many: {len(items)} items",
-                extra={"count": len(items), "ttl_seconds": int(ttl.total_seconds()) if ttl else None}
+                extra={"count": len(items), "ttl_seconds": ttl_seconds, "nx": nx}
             )
             return True
 
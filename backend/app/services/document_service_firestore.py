@@ -64,6 +64,14 @@ class DocumentServiceFirestore(IDocumentService):
         self.storage = storage_service
         self._upload_sessions: Dict[str, Dict[str, Any]] = {}
 
+        # Firestore queries are immutable, so the constant part of the
+        # "current documents of a patient" query is built once and only the
+        # patient filter is added per call. Served by the composite index
+        # (patient_id ASC, status ASC, created_at DESC).
+        self._current_documents_query = self.db.collection(Collections.DOCUMENTS).where(
+            filter=FieldFilter("status", "==", DocumentStatus.CURRENT.value)
+        ).order_by("created_at", direction="DESCENDING")
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -802,11 +810,7 @@ class DocumentServiceFirestore(IDocumentService):
             if not version_list:
                 raise NotFoundException(f"Version {version} not found for document {document_id}")
 
-            ver_data = version_list[0].to_dict()
-            gcs_path = ver_data.get("gcs_object_name", "")
-            filename = ver_data.get("original_filename", "")
-            content_type = ver_data.get("content_type", "application/octet-stream")
-            ver_num = ver_data.get("version", 1)
+            file_data = version_list[0].to_dict()
         else:
             # Get latest from document
             doc = self.db.collection(Collections.DOCUMENTS).document(str(document_id)).get()
@@ -814,11 +818,25 @@ class DocumentServiceFirestore(IDocumentService):
             if not doc.exists:
                 raise NotFoundException(f"Document {document_id} not found")
 
-            doc_data = doc.to_dict()
-            gcs_path = doc_data.get("gcs_object_name", "")
-            filename = doc_data.get("original_filename", "")
-            content_type = doc_data.get("content_type", "application/octet-stream")
-            ver_num = doc_data.get("version", 1)
+            file_data = doc.to_dict()
+
+        return await self._build_download_url(document_id, file_data, expiration_minutes)
+
+    async def _build_download_url(
+        self,
+        document_id: UUID,
+        file_data: dict,
+        expiration_minutes: int
+    ) -> DocumentDownloadUrl:
+        """
+        Build a signed download URL from already-fetched document or version data.
+
+        Both document and version records carry the same file fields.
+        """
+        gcs_path = file_data.get("gcs_object_name", "")
+        filename = file_data.get("original_filename", "")
+        content_type = file_data.get("content_type", "application/octet-stream")
+        ver_num = file_data.get("version", 1)
 
         # Generate signed URL
         expires_at = datetime.utcnow() + timedelta(minutes=expiration_minutes)
@@ -831,6 +849,7 @@ class DocumentServiceFirestore(IDocumentService):
                 filename=filename
             )
             url = signed_url.url
+            expires_at = signed_url.expires_at
 
         return DocumentDownloadUrl(
             document_id=document_id,
@@ -847,18 +866,19 @@ class DocumentServiceFirestore(IDocumentService):
         expiration_minutes: int = 60
     ) -> List[DocumentDownloadUrl]:
         """Get download URLs for all patient documents."""
-        docs = self.db.collection(Collections.DOCUMENTS).where(
+        docs = self._current_documents_query.where(
             filter=FieldFilter("patient_id", "==", str(patient_id))
-        ).where(
-            filter=FieldFilter("status", "==", DocumentStatus.CURRENT.value)
         ).stream()
 
+        # The query already returns each document's latest file fields,
+        # so build URLs directly instead of re-reading every document
         urls = []
         for doc in docs:
             doc_data = doc.to_dict()
-            url = await self.get_download_url(
+            url = await self._build_download_url(
                 UUID(doc_data["id"]),
-                expiration_minutes=expiration_minutes
+                doc_data,
+                expiration_minutes
             )
             urls.append(url)
 
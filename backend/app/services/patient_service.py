@@ -7,18 +7,24 @@ following HL7 FHIR standards.
 @module services.patient_service
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 from uuid import UUID
 from datetime import date
 import logging
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import Select, select, insert, update, exists, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, load_only
 
 from app.core.interfaces.patient_interface import IPatientService
 from app.core.exceptions import NotFoundException, ConflictException, ValidationException
-from app.models.database import Patient, MedicalHistory, ImagingStudy, Document
+from app.models.database import (
+    Patient,
+    MedicalHistory,
+    ImagingStudy,
+    Document,
+    PATIENT_SEARCH_TEXT
+)
 from app.models.patient_schemas import (
     PatientCreate,
     PatientUpdate,
@@ -32,6 +38,22 @@ from app.models.patient_schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Columns read by PatientService._patient_to_summary (full_name is built from
+# the name parts). List queries load only these, so each row hydrates a
+# handful of attributes instead of the full patient record.
+_PATIENT_SUMMARY_COLUMNS = (
+    Patient.id,
+    Patient.mrn,
+    Patient.name_prefix,
+    Patient.given_name,
+    Patient.middle_name,
+    Patient.family_name,
+    Patient.name_suffix,
+    Patient.birth_date,
+    Patient.gender,
+    Patient.status
+)
+
 
 class PatientService(IPatientService):
     """
@@ -100,6 +122,47 @@ class PatientService(IPatientService):
             status=patient.status
         )
 
+    @staticmethod
+    def _reject_cursor(cursor: Optional[str]) -> None:
+        """Cursor pagination is only implemented by the Firestore service."""
+        if cursor:
+            raise ValidationException(
+                message="Cursor pagination is not supported; use page",
+                error_code="CURSOR_NOT_SUPPORTED",
+                details={"cursor": cursor}
+            )
+
+    async def _fetch_page(
+        self,
+        query: Select,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Patient], int]:
+        """
+        Fetch one page of a patient query together with its unpaginated total.
+
+        COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so every returned
+        row carries the total and a single round trip serves both. A page
+        past the end has no row to carry it; only then is the total counted
+        separately.
+        """
+        result = await self.db.execute(
+            query.add_columns(func.count().over().label("total"))
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+
+        total_result = await self.db.execute(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        return [], total_result.scalar() or 0
+
     async def create_patient(
         self,
         data: PatientCreate,
@@ -108,9 +171,9 @@ class PatientService(IPatientService):
         """Create a new patient record."""
         # Check if MRN already exists
         existing = await self.db.execute(
-            select(Patient).where(Patient.mrn == data.mrn)
+            select(exists().where(Patient.mrn == data.mrn))
         )
-        if existing.scalar_one_or_none():
+        if existing.scalar():
             raise ConflictException(
                 message=f"Patient with MRN '{data.mrn}' already exists",
                 error_code="PATIENT_MRN_EXISTS",
@@ -166,37 +229,50 @@ class PatientService(IPatientService):
         include_stats: bool = False
     ) -> PatientResponse:
         """Get a patient by ID."""
-        result = await self.db.execute(
-            select(Patient).where(Patient.id == patient_id)
-        )
-        patient = result.scalar_one_or_none()
+        query = select(Patient).where(Patient.id == patient_id)
 
-        if not patient:
+        if include_stats:
+            # Counts as scalar subqueries: one round trip instead of three
+            query = query.add_columns(
+                select(func.count(ImagingStudy.id))
+                .where(ImagingStudy.patient_id == Patient.id)
+                .scalar_subquery(),
+                select(func.count(Document.id))
+                .where(Document.patient_id == Patient.id)
+                .scalar_subquery()
+            )
+
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+
+        if not row:
             raise NotFoundException(
                 message="Patient not found",
                 error_code="PATIENT_NOT_FOUND",
                 details={"patient_id": str(patient_id)}
             )
 
-        study_count = None
-        document_count = None
-
         if include_stats:
-            # Get study count
-            study_result = await self.db.execute(
-                select(func.count(ImagingStudy.id))
-                .where(ImagingStudy.patient_id == patient_id)
-            )
-            study_count = study_result.scalar() or 0
+            patient, study_count, document_count = row
+            return self._patient_to_response(patient, study_count or 0, document_count or 0)
 
-            # Get document count
-            doc_result = await self.db.execute(
-                select(func.count(Document.id))
-                .where(Document.patient_id == patient_id)
-            )
-            document_count = doc_result.scalar() or 0
+        return self._patient_to_response(row[0])
+
+    async def get_patients_bulk(
+        self,
+        patient_ids: List[UUID]
+    ) -> Dict[UUID, PatientResponse]:
+        """Get several patients by ID with one IN query."""
+        if not patient_ids:
+            return {}
 
-        return self._patient_to_response(patient, study_count, document_count)
+        result = await self.db.execute(
+            select(Patient).where(Patient.id.in_(patient_ids))
+        )
+        return {
+            patient.id: self._patient_to_response(patient)
+            for patient in result.scalars()
+        }
 
     async def get_patient_by_mrn(self, mrn: str) -> Optional[PatientResponse]:
         """Get a patient by MRN."""
@@ -217,8 +293,17 @@ class PatientService(IPatientService):
         updated_by: Optional[UUID] = None
     ) -> PatientResponse:
         """Update a patient record."""
+        # Update only provided fields
+        update_data = data.model_dump(exclude_unset=True)
+
+        # One UPDATE ... RETURNING instead of SELECT + flush + refresh;
+        # populate_existing refreshes the instance if the session holds it
         result = await self.db.execute(
-            select(Patient).where(Patient.id == patient_id)
+            update(Patient)
+            .where(Patient.id == patient_id)
+            .values(**update_data, updated_by=updated_by)
+            .returning(Patient)
+            .execution_options(populate_existing=True)
         )
         patient = result.scalar_one_or_none()
 
@@ -229,17 +314,6 @@ class PatientService(IPatientService):
                 details={"patient_id": str(patient_id)}
             )
 
-        # Update only provided fields
-        update_data = data.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(patient, field, value)
-
-        patient.updated_by = updated_by
-
-        await self.db.flush()
-        await self.db.refresh(patient)
-
         logger.info(
             "Patient updated",
             extra={
@@ -289,24 +363,18 @@ class PatientService(IPatientService):
         search: PatientSearch
     ) -> Tuple[List[PatientSummary], int]:
         """Search patients with filters and pagination."""
+        self._reject_cursor(search.cursor)
+
         # Base query
-        query = select(Patient)
-        count_query = select(func.count(Patient.id))
+        query = select(Patient).options(load_only(*_PATIENT_SUMMARY_COLUMNS))
 
         # Apply filters
         conditions = []
 
         if search.query:
-            # Full-text search on name, MRN, email
-            search_term = f"%{search.query}%"
-            conditions.append(
-                or_(
-                    Patient.mrn.ilike(search_term),
-                    Patient.given_name.ilike(search_term),
-                    Patient.family_name.ilike(search_term),
-                    Patient.email.ilike(search_term)
-                )
-            )
+            # Substring search on MRN, name and email, served by the
+            # ix_patients_search_trgm index instead of a sequential scan
+            conditions.append(PATIENT_SEARCH_TEXT.ilike(f"%{search.query}%"))
 
         if search.mrn:
             conditions.append(Patient.mrn == search.mrn.upper())
@@ -332,11 +400,6 @@ class PatientService(IPatientService):
         # Apply conditions
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-
-        # Get total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
 
         # Apply sorting
         sort_column = getattr(Patient, search.sort_by, Patient.family_name)
@@ -344,13 +407,9 @@ class PatientService(IPatientService):
             sort_column = sort_column.desc()
         query = query.order_by(sort_column)
 
-        # Apply pagination
+        # Apply pagination and execute
         offset = (search.page - 1) * search.page_size
-        query = query.offset(offset).limit(search.page_size)
-
-        # Execute
-        result = await self.db.execute(query)
-        patients = result.scalars().all()
+        patients, total = await self._fetch_page(query, offset, search.page_size)
 
         return [self._patient_to_summary(p) for p in patients], total
 
@@ -358,27 +417,21 @@ class PatientService(IPatientService):
         self,
         page: int = 1,
         page_size: int = 20,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> Tuple[List[PatientSummary], int]:
         """List all patients with pagination."""
-        query = select(Patient)
-        count_query = select(func.count(Patient.id))
+        self._reject_cursor(cursor)
+
+        query = select(Patient).options(load_only(*_PATIENT_SUMMARY_COLUMNS))
 
         if status:
             query = query.where(Patient.status == status)
-            count_query = count_query.where(Patient.status == status)
-
-        # Get total
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
 
         # Apply pagination
         offset = (page - 1) * page_size
         query = query.order_by(Patient.family_name, Patient.given_name)
-        query = query.offset(offset).limit(page_size)
-
-        result = await self.db.execute(query)
-        patients = result.scalars().all()
+        patients, total = await self._fetch_page(query, offset, page_size)
 
         return [self._patient_to_summary(p) for p in patients], total
 
@@ -430,36 +483,82 @@ class PatientService(IPatientService):
 
         return MedicalHistoryResponse.model_validate(history)
 
-    async def get_medical_history(
+    async def add_medical_history_bulk(
         self,
         patient_id: UUID,
-        active_only: bool = False
+        items: List[MedicalHistoryCreate],
+        recorded_by: Optional[str] = None
     ) -> List[MedicalHistoryResponse]:
-        """Get medical history for a patient."""
+        """Add several medical history entries with one INSERT ... RETURNING."""
         # Verify patient exists
-        patient_result = await self.db.execute(
-            select(Patient.id).where(Patient.id == patient_id)
+        patient_exists = await self.db.execute(
+            select(exists().where(Patient.id == patient_id))
         )
-        if not patient_result.scalar_one_or_none():
+        if not patient_exists.scalar():
             raise NotFoundException(
                 message="Patient not found",
                 error_code="PATIENT_NOT_FOUND",
                 details={"patient_id": str(patient_id)}
             )
 
-        query = select(MedicalHistory).where(
-            MedicalHistory.patient_id == patient_id
+        if not items:
+            return []
+
+        result = await self.db.execute(
+            insert(MedicalHistory).returning(MedicalHistory, sort_by_parameter_order=True),
+            [
+                {**item.model_dump(), "patient_id": patient_id, "recorded_by": recorded_by}
+                for item in items
+            ]
         )
+        histories = result.scalars().all()
 
-        if active_only:
-            query = query.where(MedicalHistory.is_active == True)
+        logger.info(
+            "Medical history added",
+            extra={
+                "patient_id": str(patient_id),
+                "count": len(histories)
+            }
+        )
+
+        return [MedicalHistoryResponse.model_validate(history) for history in histories]
+
+    async def get_medical_history(
+        self,
+        patient_id: UUID,
+        active_only: bool = False
+    ) -> List[MedicalHistoryResponse]:
+        """Get medical history for a patient."""
+        history_filter = MedicalHistory.patient_id == Patient.id
 
-        query = query.order_by(MedicalHistory.recorded_at.desc())
+        if active_only:
+            history_filter = and_(history_filter, MedicalHistory.is_active == True)
+
+        # Outer join from the patient: an existing patient always yields at
+        # least one row (with a NULL entry if it has no history), so the
+        # existence check and the history fetch share one round trip.
+        query = (
+            select(Patient.id, MedicalHistory)
+            .outerjoin(MedicalHistory, history_filter)
+            .where(Patient.id == patient_id)
+            .order_by(MedicalHistory.recorded_at.desc())
+        )
 
         result = await self.db.execute(query)
-        history_entries = result.scalars().all()
+        rows = result.all()
+
+        if not rows:
+            raise NotFoundException(
+                message="Patient not found",
+                error_code="PATIENT_NOT_FOUND",
+                details={"patient_id": str(patient_id)}
+            )
 
-        return [MedicalHistoryResponse.model_validate(h) for h in history_entries]
+        return [
+            MedicalHistoryResponse.model_validate(history)
+            for _, history in rows
+            if history is not None
+        ]
 
     async def update_medical_history(
         self,
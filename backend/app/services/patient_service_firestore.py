@@ -7,12 +7,14 @@ following HL7 FHIR standards with Firestore backend.
 @module services.patient_service_firestore
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 from uuid import UUID, uuid4
-from datetime import date, datetime
+from datetime import date, datetime, time
+import asyncio
 import logging
 
-from google.cloud.firestore_v1 import FieldFilter
+from cachetools import TTLCache
+from google.cloud.firestore_v1 import FieldFilter, transactional
 
 from app.core.firebase import (
     get_firestore_client,
@@ -40,6 +42,17 @@ from app.models.patient_schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Patient documents are read by most patient-scoped endpoints but rarely
+# change. The service is built per request, so the caches live at module
+# level; the TTL bounds staleness from writes made by other instances.
+_PATIENT_CACHE_SIZE = 2048
+_PATIENT_CACHE_TTL = 30  # seconds
+
+# patient_id -> document data (including "id")
+_patient_docs: TTLCache = TTLCache(maxsize=_PATIENT_CACHE_SIZE, ttl=_PATIENT_CACHE_TTL)
+# upper-cased MRN -> patient_id
+_patient_ids_by_mrn: TTLCache = TTLCache(maxsize=_PATIENT_CACHE_SIZE, ttl=_PATIENT_CACHE_TTL)
+
 
 def _calculate_age(birth_date: date) -> int:
     """Calculate age from birth date."""
@@ -50,6 +63,16 @@ def _calculate_age(birth_date: date) -> int:
     return age
 
 
+def _to_timestamp(value: date) -> datetime:
+    """
+    Store a date as a native Firestore Timestamp (midnight UTC).
+
+    Firestore has no date type; a datetime is stored as an 8-byte Timestamp
+    and read back as a datetime, without any ISO string formatting/parsing.
+    """
+    return datetime.combine(value, time.min)
+
+
 def _build_full_name(
     given_name: str,
     family_name: str,
@@ -58,6 +81,10 @@ def _build_full_name(
     name_suffix: Optional[str] = None
 ) -> str:
     """Build full name from components."""
+    # Most patients only have given and family names
+    if not (name_prefix or middle_name or name_suffix):
+        return f"{given_name} {family_name}"
+
     parts = []
     if name_prefix:
         parts.append(name_prefix)
@@ -70,6 +97,58 @@ def _build_full_name(
     return " ".join(parts)
 
 
+# Stored enum value -> member; a dict lookup is much cheaper than Enum(value)
+_GENDERS = {gender.value: gender for gender in Gender}
+_PATIENT_STATUSES = {status.value: status for status in PatientStatus}
+
+# PatientResponse fields stored verbatim in the patient document
+_RESPONSE_FIELDS = (
+    "mrn",
+    "given_name",
+    "middle_name",
+    "family_name",
+    "name_prefix",
+    "name_suffix",
+    "phone_home",
+    "phone_mobile",
+    "phone_work",
+    "email",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postal_code",
+    "country",
+    "emergency_contact_name",
+    "emergency_contact_phone",
+    "emergency_contact_relationship",
+    "insurance_provider",
+    "insurance_policy_number"
+)
+
+# Document fields read by _doc_to_summary; list/search fetch only these
+_SUMMARY_FIELDS = [
+    "mrn",
+    "given_name",
+    "middle_name",
+    "family_name",
+    "name_prefix",
+    "name_suffix",
+    "birth_date",
+    "gender",
+    "status"
+]
+
+# Field mask for reads that only check a patient exists (every patient has an MRN)
+_EXISTS_FIELDS = ["mrn"]
+
+# Firestore accepts at most 500 writes per batch
+_WRITE_BATCH_SIZE = 500
+
+# Entries accepted by one bulk medical history import (at most 4 batches)
+MAX_BULK_HISTORY_ITEMS = 2000
+
+
 class PatientServiceFirestore(IPatientService):
     """
     Patient service implementation with Firestore backend.
@@ -94,6 +173,8 @@ class PatientServiceFirestore(IPatientService):
         elif hasattr(birth_date, 'date'):
             birth_date = birth_date.date()
 
+        # Timestamps come back as datetimes; ISO strings are patients
+        # written before scripts/migrate_patient_timestamps.py was run
         created_at = doc_data.get("created_at")
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
@@ -105,6 +186,8 @@ class PatientServiceFirestore(IPatientService):
         deceased_date = doc_data.get("deceased_date")
         if isinstance(deceased_date, str):
             deceased_date = date.fromisoformat(deceased_date)
+        elif hasattr(deceased_date, 'date'):
+            deceased_date = deceased_date.date()
 
         # Calculate age
         age = _calculate_age(birth_date) if birth_date else None
@@ -119,33 +202,13 @@ class PatientServiceFirestore(IPatientService):
         )
 
         return PatientResponse(
+            **{field: doc_data.get(field) for field in _RESPONSE_FIELDS},
             id=UUID(doc_data["id"]),
-            mrn=doc_data["mrn"],
-            given_name=doc_data["given_name"],
-            middle_name=doc_data.get("middle_name"),
-            family_name=doc_data["family_name"],
-            name_prefix=doc_data.get("name_prefix"),
-            name_suffix=doc_data.get("name_suffix"),
             full_name=full_name,
             birth_date=birth_date,
-            gender=Gender(doc_data["gender"]),
+            gender=_GENDERS[doc_data["gender"]],
             age=age,
-            phone_home=doc_data.get("phone_home"),
-            phone_mobile=doc_data.get("phone_mobile"),
-            phone_work=doc_data.get("phone_work"),
-            email=doc_data.get("email"),
-            address_line1=doc_data.get("address_line1"),
-            address_line2=doc_data.get("address_line2"),
-            city=doc_data.get("city"),
-            state=doc_data.get("state"),
-            postal_code=doc_data.get("postal_code"),
-            country=doc_data.get("country"),
-            emergency_contact_name=doc_data.get("emergency_contact_name"),
-            emergency_contact_phone=doc_data.get("emergency_contact_phone"),
-            emergency_contact_relationship=doc_data.get("emergency_contact_relationship"),
-            insurance_provider=doc_data.get("insurance_provider"),
-            insurance_policy_number=doc_data.get("insurance_policy_number"),
-            status=PatientStatus(doc_data.get("status", "active")),
+            status=_PATIENT_STATUSES[doc_data.get("status", "active")],
             deceased_date=deceased_date,
             created_at=created_at,
             updated_at=updated_at,
@@ -179,30 +242,134 @@ class PatientServiceFirestore(IPatientService):
             mrn=doc_data["mrn"],
             full_name=full_name,
             birth_date=birth_date,
-            gender=Gender(doc_data["gender"]),
-            status=PatientStatus(doc_data.get("status", "active")),
+            gender=_GENDERS[doc_data["gender"]],
+            status=_PATIENT_STATUSES[doc_data.get("status", "active")],
             study_count=study_count,
             document_count=document_count
         )
 
+    @staticmethod
+    def _cache_patient(doc_data: dict) -> None:
+        """Remember a patient document for get_patient/get_patient_by_mrn."""
+        _patient_docs[doc_data["id"]] = doc_data
+        if doc_data.get("mrn"):
+            _patient_ids_by_mrn[doc_data["mrn"]] = doc_data["id"]
+
+    @staticmethod
+    def _evict_patient(patient_id: str, mrn: Optional[str]) -> None:
+        """Drop a patient from the read caches after it has been written."""
+        _patient_docs.pop(patient_id, None)
+        if mrn:
+            _patient_ids_by_mrn.pop(mrn, None)
+
+    async def _require_patient(self, patient_id: UUID):
+        """
+        Check a patient exists, reading only its MRN.
+
+        Returns the (mrn-only) snapshot; raises NotFoundException otherwise.
+        """
+        doc = await asyncio.to_thread(
+            self.db.collection(self.collection).document(str(patient_id)).get,
+            field_paths=_EXISTS_FIELDS
+        )
+        if not doc.exists:
+            raise NotFoundException(
+                message="Patient not found",
+                error_code="PATIENT_NOT_FOUND",
+                details={"patient_id": str(patient_id)}
+            )
+        return doc
+
+    def _fetch_page(
+        self,
+        query,
+        page: int,
+        page_size: int,
+        cursor: Optional[str] = None
+    ) -> list:
+        """
+        Fetch one page of an ordered patient query.
+
+        With a cursor (the ID of the last patient of the previous page) the
+        page starts right after that document, so deep pages cost one extra
+        document read instead of reading through every skipped one. Numeric
+        pages skip server-side with offset() rather than streaming and
+        discarding the skipped documents. Only the summary fields are
+        fetched.
+        """
+        if cursor:
+            try:
+                # Patient IDs are UUIDs; anything else (e.g. "a/b") is not
+                # even a valid document path
+                UUID(cursor)
+            except ValueError:
+                cursor_doc = None
+            else:
+                cursor_doc = self.db.collection(self.collection).document(cursor).get()
+            if cursor_doc is None or not cursor_doc.exists:
+                raise ValidationException(
+                    message="Invalid pagination cursor",
+                    error_code="INVALID_CURSOR",
+                    details={"cursor": cursor}
+                )
+            query = query.start_after(cursor_doc)
+        else:
+            offset = (page - 1) * page_size
+            if offset > 0:
+                query = query.offset(offset)
+
+        return list(query.select(_SUMMARY_FIELDS).limit(page_size).stream())
+
+    async def _count(self, query) -> int:
+        """Run a count() aggregation off the event loop."""
+        result = await asyncio.to_thread(query.count().get)
+        return result[0][0].value if result else 0
+
+    async def _count_or_zero(self, query) -> int:
+        """Like _count, but a failed count is reported as 0."""
+        try:
+            return await self._count(query)
+        except Exception:
+            return 0
+
+    async def _summaries_with_counts(self, docs: list) -> List[PatientSummary]:
+        """
+        Build summaries for a page of patient documents with study/document counts.
+
+        The 2 count() aggregations per patient run concurrently, so a page
+        costs about one round trip instead of one per count.
+        """
+        patient_ids = [doc.id for doc in docs]
+        counts = await asyncio.gather(*(
+            self._count_or_zero(
+                self.db.collection(collection).where(
+                    filter=FieldFilter("patient_id", "==", patient_id)
+                )
+            )
+            for collection in (Collections.STUDIES, Collections.DOCUMENTS)
+            for patient_id in patient_ids
+        ))
+        study_counts = counts[:len(patient_ids)]
+        document_counts = counts[len(patient_ids):]
+
+        results = []
+        for doc, study_count, document_count in zip(docs, study_counts, document_counts):
+            doc_data = doc.to_dict()
+            doc_data["id"] = doc.id
+            results.append(self._doc_to_summary(
+                doc_data,
+                study_count=study_count,
+                document_count=document_count
+            ))
+
+        return results
+
     async def create_patient(
         self,
         data: PatientCreate,
         created_by: Optional[UUID] = None
     ) -> PatientResponse:
         """Create a new patient record."""
-        # Check if MRN already exists
-        existing = self.db.collection(self.collection).where(
-            filter=FieldFilter("mrn", "==", data.mrn.upper())
-        ).limit(1).get()
-
-        if list(existing):
-            raise ConflictException(
-                message=f"Patient with MRN '{data.mrn}' already exists",
-                error_code="PATIENT_MRN_EXISTS",
-                details={"mrn": data.mrn}
-            )
-
         # Generate new patient ID
         patient_id = str(uuid4())
         now = datetime.utcnow()
@@ -216,8 +383,8 @@ class PatientServiceFirestore(IPatientService):
             "family_name": data.family_name,
             "name_prefix": data.name_prefix,
             "name_suffix": data.name_suffix,
-            "birth_date": data.birth_date.isoformat() if data.birth_date else None,
-            "gender": data.gender.value if hasattr(data.gender, 'value') else data.gender,
+            "birth_date": _to_timestamp(data.birth_date) if data.birth_date else None,
+            "gender": data.gender,
             "phone_home": data.phone_home,
             "phone_mobile": data.phone_mobile,
             "phone_work": data.phone_work,
@@ -234,13 +401,31 @@ class PatientServiceFirestore(IPatientService):
             "insurance_provider": data.insurance_provider,
             "insurance_policy_number": data.insurance_policy_number,
             "status": "active",
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "created_by": str(created_by) if created_by else None
         }
 
-        # Create document
-        self.db.collection(self.collection).document(patient_id).set(patient_data)
+        mrn_query = self.db.collection(self.collection).where(
+            filter=FieldFilter("mrn", "==", data.mrn.upper())
+        ).limit(1)
+        doc_ref = self.db.collection(self.collection).document(patient_id)
+
+        # Check the MRN and create the document in one transaction, so two
+        # concurrent creates cannot both pass the check (retried on contention)
+        @transactional
+        def create_if_mrn_free(transaction) -> bool:
+            if list(mrn_query.get(transaction=transaction)):
+                return False
+            transaction.set(doc_ref, patient_data)
+            return True
+
+        if not await asyncio.to_thread(create_if_mrn_free, self.db.transaction()):
+            raise ConflictException(
+                message=f"Patient with MRN '{data.mrn}' already exists",
+                error_code="PATIENT_MRN_EXISTS",
+                details={"mrn": data.mrn}
+            )
 
         logger.info(
             "Patient created",
@@ -260,7 +445,28 @@ class PatientServiceFirestore(IPatientService):
     ) -> PatientResponse:
         """Get a patient by ID."""
         doc_ref = self.db.collection(self.collection).document(str(patient_id))
-        doc = doc_ref.get()
+
+        study_count = None
+        document_count = None
+
+        if include_stats:
+            # The patient read and both counts are independent: one round trip
+            doc, study_count, document_count = await asyncio.gather(
+                asyncio.to_thread(doc_ref.get),
+                *(
+                    self._count(
+                        self.db.collection(collection).where(
+                            filter=FieldFilter("patient_id", "==", str(patient_id))
+                        )
+                    )
+                    for collection in (Collections.STUDIES, Collections.DOCUMENTS)
+                )
+            )
+        else:
+            doc_data = _patient_docs.get(str(patient_id))
+            if doc_data is not None:
+                return self._doc_to_response(doc_data)
+            doc = await asyncio.to_thread(doc_ref.get)
 
         if not doc.exists:
             raise NotFoundException(
@@ -271,38 +477,67 @@ class PatientServiceFirestore(IPatientService):
 
         doc_data = doc.to_dict()
         doc_data["id"] = doc.id
-
-        study_count = None
-        document_count = None
-
-        if include_stats:
-            # Count studies for this patient
-            studies = self.db.collection(Collections.STUDIES).where(
-                filter=FieldFilter("patient_id", "==", str(patient_id))
-            ).count().get()
-            study_count = studies[0][0].value if studies else 0
-
-            # Count documents for this patient
-            docs = self.db.collection(Collections.DOCUMENTS).where(
-                filter=FieldFilter("patient_id", "==", str(patient_id))
-            ).count().get()
-            document_count = docs[0][0].value if docs else 0
+        self._cache_patient(doc_data)
 
         return self._doc_to_response(doc_data, study_count, document_count)
 
+    async def get_patients_bulk(
+        self,
+        patient_ids: List[UUID]
+    ) -> Dict[UUID, PatientResponse]:
+        """
+        Get several patients by ID.
+
+        Cached patients are served from memory and the rest are fetched with
+        a single get_all() call instead of one read per patient.
+        """
+        unique_ids = list(dict.fromkeys(patient_ids))
+        docs = {}
+        for patient_id in unique_ids:
+            doc_data = _patient_docs.get(str(patient_id))
+            if doc_data is not None:
+                docs[str(patient_id)] = doc_data
+
+        refs = [
+            self.db.collection(self.collection).document(str(patient_id))
+            for patient_id in unique_ids
+            if str(patient_id) not in docs
+        ]
+        if refs:
+            snapshots = await asyncio.to_thread(lambda: list(self.db.get_all(refs)))
+            for snapshot in snapshots:
+                if not snapshot.exists:
+                    continue
+                doc_data = snapshot.to_dict()
+                doc_data["id"] = snapshot.id
+                self._cache_patient(doc_data)
+                docs[snapshot.id] = doc_data
+
+        return {
+            patient_id: self._doc_to_response(docs[str(patient_id)])
+            for patient_id in unique_ids
+            if str(patient_id) in docs
+        }
+
     async def get_patient_by_mrn(self, mrn: str) -> Optional[PatientResponse]:
         """Get a patient by MRN."""
-        docs = self.db.collection(self.collection).where(
-            filter=FieldFilter("mrn", "==", mrn.upper())
-        ).limit(1).get()
-
-        doc_list = list(docs)
+        patient_id = _patient_ids_by_mrn.get(mrn.upper())
+        doc_data = _patient_docs.get(patient_id) if patient_id else None
+        if doc_data is not None:
+            return self._doc_to_response(doc_data)
+
+        doc_list = await asyncio.to_thread(
+            self.db.collection(self.collection).where(
+                filter=FieldFilter("mrn", "==", mrn.upper())
+            ).limit(1).get
+        )
         if not doc_list:
             return None
 
         doc = doc_list[0]
         doc_data = doc.to_dict()
         doc_data["id"] = doc.id
+        self._cache_patient(doc_data)
 
         return self._doc_to_response(doc_data)
 
@@ -314,7 +549,7 @@ class PatientServiceFirestore(IPatientService):
     ) -> PatientResponse:
         """Update a patient record."""
         doc_ref = self.db.collection(self.collection).document(str(patient_id))
-        doc = doc_ref.get()
+        doc = await asyncio.to_thread(doc_ref.get)
 
         if not doc.exists:
             raise NotFoundException(
@@ -326,22 +561,17 @@ class PatientServiceFirestore(IPatientService):
         # Build update data
         update_data = data.model_dump(exclude_unset=True)
 
-        # Convert date fields to ISO strings
+        # Convert date fields to Timestamps
         for date_field in ["birth_date", "deceased_date"]:
             if date_field in update_data and update_data[date_field]:
-                update_data[date_field] = update_data[date_field].isoformat()
-
-        # Convert enum fields
-        if "gender" in update_data and hasattr(update_data["gender"], 'value'):
-            update_data["gender"] = update_data["gender"].value
-        if "status" in update_data and hasattr(update_data["status"], 'value'):
-            update_data["status"] = update_data["status"].value
+                update_data[date_field] = _to_timestamp(update_data[date_field])
 
-        update_data["updated_at"] = datetime.utcnow().isoformat()
+        update_data["updated_at"] = datetime.utcnow()
         update_data["updated_by"] = str(updated_by) if updated_by else None
 
         # Update document
-        doc_ref.update(update_data)
+        await asyncio.to_thread(doc_ref.update, update_data)
+        self._evict_patient(doc.id, doc.get("mrn"))
 
         logger.info(
             "Patient updated",
@@ -352,10 +582,9 @@ class PatientServiceFirestore(IPatientService):
             }
         )
 
-        # Get updated document
-        updated_doc = doc_ref.get()
-        doc_data = updated_doc.to_dict()
-        doc_data["id"] = updated_doc.id
+        # The stored document is the one read above with update_data applied;
+        # build the response from that instead of reading it back
+        doc_data = {**doc.to_dict(), **update_data, "id": doc.id}
 
         return self._doc_to_response(doc_data)
 
@@ -366,21 +595,15 @@ class PatientServiceFirestore(IPatientService):
     ) -> bool:
         """Soft delete a patient (set status to inactive)."""
         doc_ref = self.db.collection(self.collection).document(str(patient_id))
-        doc = doc_ref.get()
-
-        if not doc.exists:
-            raise NotFoundException(
-                message="Patient not found",
-                error_code="PATIENT_NOT_FOUND",
-                details={"patient_id": str(patient_id)}
-            )
+        doc = await self._require_patient(patient_id)
 
         # Soft delete - just update status
-        doc_ref.update({
+        await asyncio.to_thread(doc_ref.update, {
             "status": "inactive",
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow(),
             "updated_by": str(deleted_by) if deleted_by else None
         })
+        self._evict_patient(doc.id, doc.get("mrn"))
 
         logger.info(
             "Patient deactivated",
@@ -409,16 +632,13 @@ class PatientServiceFirestore(IPatientService):
             query = query.where(filter=FieldFilter("family_name", "<=", search.family_name + "\uf8ff"))
 
         if search.gender:
-            gender_value = search.gender.value if hasattr(search.gender, 'value') else search.gender
-            query = query.where(filter=FieldFilter("gender", "==", gender_value))
+            query = query.where(filter=FieldFilter("gender", "==", search.gender))
 
         if search.status:
-            status_value = search.status.value if hasattr(search.status, 'value') else search.status
-            query = query.where(filter=FieldFilter("status", "==", status_value))
+            query = query.where(filter=FieldFilter("status", "==", search.status))
 
-        # Get total count first
-        count_result = query.count().get()
-        total = count_result[0][0].value if count_result else 0
+        # Total count of the filtered (unordered, unpaginated) query
+        count_query = query
 
         # Apply ordering - default to family_name ascending
         if search.sort_by == "created_at":
@@ -428,59 +648,20 @@ class PatientServiceFirestore(IPatientService):
             direction = "DESCENDING" if search.sort_order == "desc" else "ASCENDING"
             query = query.order_by("family_name", direction=direction)
 
-        # Apply pagination
-        offset = (search.page - 1) * search.page_size
-        if offset > 0:
-            # Firestore pagination with offset (not efficient for large offsets)
-            query = query.limit(search.page_size + offset)
-            docs = list(query.stream())
-            docs = docs[offset:offset + search.page_size]
-        else:
-            query = query.limit(search.page_size)
-            docs = list(query.stream())
-
-        # Collect patient IDs for batch count queries
-        patient_ids = [doc.id for doc in docs]
-
-        # Get study counts for all patients in this page
-        study_counts = {}
-        for patient_id in patient_ids:
-            try:
-                studies = self.db.collection(Collections.STUDIES).where(
-                    filter=FieldFilter("patient_id", "==", patient_id)
-                ).count().get()
-                study_counts[patient_id] = studies[0][0].value if studies else 0
-            except Exception:
-                study_counts[patient_id] = 0
-
-        # Get document counts for all patients in this page
-        document_counts = {}
-        for patient_id in patient_ids:
-            try:
-                documents = self.db.collection(Collections.DOCUMENTS).where(
-                    filter=FieldFilter("patient_id", "==", patient_id)
-                ).count().get()
-                document_counts[patient_id] = documents[0][0].value if documents else 0
-            except Exception:
-                document_counts[patient_id] = 0
-
-        results = []
-        for doc in docs:
-            doc_data = doc.to_dict()
-            doc_data["id"] = doc.id
-            results.append(self._doc_to_summary(
-                doc_data,
-                study_count=study_counts.get(doc.id, 0),
-                document_count=document_counts.get(doc.id, 0)
-            ))
+        # Count and fetch the page concurrently
+        total, docs = await asyncio.gather(
+            self._count(count_query),
+            asyncio.to_thread(self._fetch_page, query, search.page, search.page_size, search.cursor)
+        )
 
-        return results, total
+        return await self._summaries_with_counts(docs), total
 
     async def list_patients(
         self,
         page: int = 1,
         page_size: int = 20,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> Tuple[List[PatientSummary], int]:
         """List all patients with pagination and study/document counts."""
         query = self.db.collection(self.collection)
@@ -488,59 +669,16 @@ class PatientServiceFirestore(IPatientService):
         if status:
             query = query.where(filter=FieldFilter("status", "==", status))
 
-        # Get total count
-        count_result = query.count().get()
-        total = count_result[0][0].value if count_result else 0
-
         # Apply ordering
-        query = query.order_by("family_name").order_by("given_name")
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        if offset > 0:
-            query = query.limit(page_size + offset)
-            docs = list(query.stream())
-            docs = docs[offset:offset + page_size]
-        else:
-            query = query.limit(page_size)
-            docs = list(query.stream())
-
-        # Collect patient IDs for batch count queries
-        patient_ids = [doc.id for doc in docs]
+        page_query = query.order_by("family_name").order_by("given_name")
 
-        # Get study counts for all patients in this page
-        study_counts = {}
-        for patient_id in patient_ids:
-            try:
-                studies = self.db.collection(Collections.STUDIES).where(
-                    filter=FieldFilter("patient_id", "==", patient_id)
-                ).count().get()
-                study_counts[patient_id] = studies[0][0].value if studies else 0
-            except Exception:
-                study_counts[patient_id] = 0
-
-        # Get document counts for all patients in this page
-        document_counts = {}
-        for patient_id in patient_ids:
-            try:
-                documents = self.db.collection(Collections.DOCUMENTS).where(
-                    filter=FieldFilter("patient_id", "==", patient_id)
-                ).count().get()
-                document_counts[patient_id] = documents[0][0].value if documents else 0
-            except Exception:
-                document_counts[patient_id] = 0
-
-        results = []
-        for doc in docs:
-            doc_data = doc.to_dict()
-            doc_data["id"] = doc.id
-            results.append(self._doc_to_summary(
-                doc_data,
-                study_count=study_counts.get(doc.id, 0),
-                document_count=document_counts.get(doc.id, 0)
-            ))
+        # Count and fetch the page concurrently
+        total, docs = await asyncio.gather(
+            self._count(query),
+            asyncio.to_thread(self._fetch_page, page_query, page, page_size, cursor)
+        )
 
-        return results, total
+        return await self._summaries_with_counts(docs), total
 
     # Medical History methods would go here (simplified for now)
 
@@ -551,21 +689,126 @@ class PatientServiceFirestore(IPatientService):
         recorded_by: Optional[str] = None
     ) -> MedicalHistoryResponse:
         """Add a medical history entry for a patient."""
-        # Verify patient exists
-        doc = self.db.collection(self.collection).document(str(patient_id)).get()
-        if not doc.exists:
-            raise NotFoundException(
-                message="Patient not found",
-                error_code="PATIENT_NOT_FOUND",
-                details={"patient_id": str(patient_id)}
-            )
+        await self._require_patient(patient_id)
 
         # Create medical history in subcollection
-        history_id = str(uuid4())
+        history_id = uuid4()
+        now = datetime.utcnow()
+
+        # Store in subcollection
+        await asyncio.to_thread(
+            self.db.collection(self.collection).document(str(patient_id)).collection(
+                "medical_history"
+            ).document(str(history_id)).set,
+            self._history_data(patient_id, history_id, data, recorded_by, now)
+        )
+
+        logger.info(
+            "Medical history added",
+            extra={
+                "patient_id": str(patient_id),
+                "history_id": str(history_id),
+                "condition": data.condition_name
+            }
+        )
+
+        return self._history_response(patient_id, history_id, data, recorded_by, now)
+
+    async def add_medical_history_bulk(
+        self,
+        patient_id: UUID,
+        items: List[MedicalHistoryCreate],
+        recorded_by: Optional[str] = None
+    ) -> List[MedicalHistoryResponse]:
+        """
+        Add several medical history entries for a patient.
+
+        Entries are written with WriteBatches of up to 500 writes, and the
+        batches are committed concurrently, so an import costs about one
+        round trip instead of one per entry.
+
+        Each batch is atomic but the import as a whole is not: if a batch
+        fails, the others may already be written. Their entry IDs are
+        logged and the first error is raised.
+
+        Raises:
+            ValidationException: More than MAX_BULK_HISTORY_ITEMS entries
+        """
+        if len(items) > MAX_BULK_HISTORY_ITEMS:
+            raise ValidationException(
+                message=f"At most {MAX_BULK_HISTORY_ITEMS} medical history entries per import",
+                error_code="TOO_MANY_ITEMS",
+                details={"count": len(items), "max": MAX_BULK_HISTORY_ITEMS}
+            )
+
+        await self._require_patient(patient_id)
+
+        history_ref = self.db.collection(self.collection).document(str(patient_id)).collection(
+            "medical_history"
+        )
         now = datetime.utcnow()
+        history_ids = [uuid4() for _ in items]
+
+        batches = []
+        for start in range(0, len(items), _WRITE_BATCH_SIZE):
+            batch = self.db.batch()
+            for history_id, data in zip(
+                history_ids[start:start + _WRITE_BATCH_SIZE],
+                items[start:start + _WRITE_BATCH_SIZE]
+            ):
+                batch.set(
+                    history_ref.document(str(history_id)),
+                    self._history_data(patient_id, history_id, data, recorded_by, now)
+                )
+            batches.append(batch)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(batch.commit) for batch in batches),
+            return_exceptions=True
+        )
+        failed = [i for i, result in enumerate(results) if isinstance(result, BaseException)]
+        if failed:
+            committed_ids = [
+                str(history_id)
+                for i in range(len(batches)) if i not in failed
+                for history_id in history_ids[i * _WRITE_BATCH_SIZE:(i + 1) * _WRITE_BATCH_SIZE]
+            ]
+            logger.error(
+                "Medical history import partially written",
+                extra={
+                    "patient_id": str(patient_id),
+                    "batches": len(batches),
+                    "failed_batches": failed,
+                    "committed_ids": committed_ids
+                }
+            )
+            raise results[failed[0]]
 
-        history_data = {
-            "id": history_id,
+        logger.info(
+            "Medical history added",
+            extra={
+                "patient_id": str(patient_id),
+                "count": len(items),
+                "batches": len(batches)
+            }
+        )
+
+        return [
+            self._history_response(patient_id, history_id, data, recorded_by, now)
+            for history_id, data in zip(history_ids, items)
+        ]
+
+    @staticmethod
+    def _history_data(
+        patient_id: UUID,
+        history_id: UUID,
+        data: MedicalHistoryCreate,
+        recorded_by: Optional[str],
+        recorded_at: datetime
+    ) -> dict:
+        """Build the Firestore document for a medical history entry."""
+        return {
+            "id": str(history_id),
             "patient_id": str(patient_id),
             "condition_name": data.condition_name,
             "condition_code": data.condition_code,
@@ -576,25 +819,20 @@ class PatientServiceFirestore(IPatientService):
             "severity": data.severity,
             "notes": data.notes,
             "recorded_by": recorded_by,
-            "recorded_at": now.isoformat()
+            "recorded_at": recorded_at.isoformat()
         }
 
-        # Store in subcollection
-        self.db.collection(self.collection).document(str(patient_id)).collection(
-            "medical_history"
-        ).document(history_id).set(history_data)
-
-        logger.info(
-            "Medical history added",
-            extra={
-                "patient_id": str(patient_id),
-                "history_id": history_id,
-                "condition": data.condition_name
-            }
-        )
-
+    @staticmethod
+    def _history_response(
+        patient_id: UUID,
+        history_id: UUID,
+        data: MedicalHistoryCreate,
+        recorded_by: Optional[str],
+        recorded_at: datetime
+    ) -> MedicalHistoryResponse:
+        """Build the response for a medical history entry that was just written."""
         return MedicalHistoryResponse(
-            id=UUID(history_id),
+            id=history_id,
             patient_id=patient_id,
             condition_name=data.condition_name,
             condition_code=data.condition_code,
@@ -605,7 +843,7 @@ class PatientServiceFirestore(IPatientService):
             severity=data.severity,
             notes=data.notes,
             recorded_by=recorded_by,
-            recorded_at=now
+            recorded_at=recorded_at
         )
 
     async def get_medical_history(
@@ -614,24 +852,19 @@ class PatientServiceFirestore(IPatientService):
         active_only: bool = False
     ) -> List[MedicalHistoryResponse]:
         """Get medical history for a patient."""
-        # Verify patient exists
-        doc = self.db.collection(self.collection).document(str(patient_id)).get()
-        if not doc.exists:
-            raise NotFoundException(
-                message="Patient not found",
-                error_code="PATIENT_NOT_FOUND",
-                details={"patient_id": str(patient_id)}
-            )
-
-        query = self.db.collection(self.collection).document(str(patient_id)).collection(
-            "medical_history"
-        )
+        patient_ref = self.db.collection(self.collection).document(str(patient_id))
+        query = patient_ref.collection("medical_history")
 
         if active_only:
             query = query.where(filter=FieldFilter("is_active", "==", True))
 
         query = query.order_by("recorded_at", direction="DESCENDING")
-        docs = query.stream()
+
+        # Verify patient exists while the history is read: one round trip
+        _, docs = await asyncio.gather(
+            self._require_patient(patient_id),
+            asyncio.to_thread(lambda: list(query.stream()))
+        )
 
         results = []
         for doc in docs:
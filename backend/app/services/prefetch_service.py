@@ -6,13 +6,120 @@ Pre-loads slices based on user navigation patterns.
 """
 
 import asyncio
-from typing import List, Dict, Optional
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, Dict, Optional, Sequence, Set, Tuple
+
+from cachetools import TTLCache
+
 from app.core.logging import get_logger
 from app.core.config import get_settings
+from app.services.imaging_service import SliceSource
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Background prefetches per file. Shared by all PrefetchService instances
+# (one is built per request); holding the tasks here also keeps them from
+# being garbage-collected while they run.
+_inflight: Dict[str, Set[asyncio.Task]] = {}
+_last_direction: Dict[str, str] = {}
+
+# Slice loads in progress, keyed by slice cache key. A second prefetch of the
+# same slice (e.g. two viewers on one study) awaits the first instead of
+# loading it again.
+_inflight_slices: Dict[str, asyncio.Future] = {}
+
+# Recently viewed slice indices kept per file, used to predict the next ones
+_NAVIGATION_HISTORY_LENGTH = 4
+_MAX_PREDICTED_STRIDE = 4
+
+
+@dataclass
+class _PrefetchSession:
+    """Prefetch state of one file: recent navigation and the adaptive window."""
+
+    window: int
+    history: Deque[int] = field(default_factory=lambda: deque(maxlen=_NAVIGATION_HISTORY_LENGTH))
+    prefetched: Set[int] = field(default_factory=set)
+
+
+class _PrefetchSessions:
+    """
+    Per-file prefetch sessions, shared by all PrefetchService instances.
+
+    Each file adapts its prefetch window to how its prefetched slices fare
+    in the cache. A prefetched slice that is no longer cached when it is
+    viewed was evicted unused (cache pollution), so the window is halved;
+    one that is still cached grows the window by one slice
+    (additive-increase / multiplicative-decrease, as in TCP congestion
+    control). Keeping this per file means one user's evictions do not
+    throttle prefetching for everyone else. Files idle for ten minutes age
+    out.
+    """
+
+    MAX_WINDOW = 10
+
+    def __init__(self):
+        self.pollution_events = 0
+        self._sessions: TTLCache = TTLCache(maxsize=1024, ttl=600)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, file_id: str) -> _PrefetchSession:
+        """Return the session of a file, creating it on first use."""
+        session = self._sessions.get(file_id)
+        if session is None:
+            session = _PrefetchSession(window=self.MAX_WINDOW)
+        # Re-inserting restarts the TTL, so only idle files age out
+        self._sessions[file_id] = session
+        return session
+
+    def record_prefetched(self, file_id: str, indices: List[int]) -> None:
+        """Remember slices that were just prefetched."""
+        self.get(file_id).prefetched.update(indices)
+
+    def report_access(self, file_id: str, slice_index: int, was_hit: bool) -> None:
+        """Update a file's window from the outcome of viewing a slice."""
+        session = self._sessions.get(file_id)
+        if session is None or slice_index not in session.prefetched:
+            return
+        session.prefetched.discard(slice_index)
+
+        if was_hit:
+            session.window = min(session.window + 1, self.MAX_WINDOW)
+        else:
+            self.pollution_events += 1
+            session.window = max(1, session.window // 2)
+            logger.debug(
+                "Prefetched slice evicted before use, shrinking prefetch window",
+                extra={"file_id": file_id, "slice_index": slice_index, "window": session.window}
+            )
+
+
+_sessions = _PrefetchSessions()
+
+
+def _forget_task(file_id: str, task: asyncio.Task) -> None:
+    """Drop a finished prefetch task from the in-flight registry."""
+    tasks = _inflight.get(file_id)
+    if tasks is None:
+        return
+    tasks.discard(task)
+    if not tasks:
+        del _inflight[file_id]
+        _last_direction.pop(file_id, None)
+
+
+async def wait_for_prefetches() -> None:
+    """Wait for all in-flight background prefetches (application shutdown)."""
+    tasks = [task for tasks in _inflight.values() for task in tasks]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class PrefetchService:
     """
@@ -20,12 +127,15 @@ class PrefetchService:
 
     Strategy: Prefetch N slices ahead based on user navigation pattern.
     Typical usage: When user views slice N, prefetch N+1, N+2, N+3.
+    When recent moves share a stride s (e.g. skipping every other slice),
+    prefetch N+s, N+2s, ... instead; when they jump back and forth, skip
+    prefetching rather than fill the cache with slices that won't be read.
 
     Features:
     - Configurable prefetch count (default: 3 slices)
-    - Priority-based prefetching (low/normal/high)
+    - Priority-based concurrency (low/normal/high)
     - Automatic cache population
-    - Background execution (non-blocking)
+    - Background execution (schedule_prefetch_slices, non-blocking)
     - Skip already cached slices (efficient)
     """
 
@@ -53,12 +163,15 @@ class PrefetchService:
         self.priority = priority or getattr(settings, 'PREFETCH_PRIORITY', 'normal')
         self.enabled = getattr(settings, 'ENABLE_PREFETCHING', True)
 
-        # Priority configuration (delay between prefetch requests)
-        self._priority_delays = {
-            'low': 0.5,      # 500ms between requests (low priority)
-            'normal': 0.2,   # 200ms between requests (balanced)
-            'high': 0.05,    # 50ms between requests (aggressive)
+        # Priority configuration (slices prefetched concurrently)
+        max_concurrency = getattr(settings, 'PREFETCH_MAX_CONCURRENCY', 8)
+        self._priority_concurrency = {
+            'low': 1,                                 # one slice at a time
+            'normal': max(1, max_concurrency // 2),   # balanced
+            'high': max_concurrency,                  # aggressive
         }
+        # Priority is fixed per instance: resolve its limit once
+        self._concurrency = self._priority_concurrency.get(self.priority, 1)
 
         logger.info(
             "PrefetchService initialized",
@@ -69,9 +182,56 @@ class PrefetchService:
             }
         )
 
+    def schedule_prefetch_slices(
+        self,
+        file_id: str,
+        source: SliceSource,
+        current_slice: int,
+        total_slices: int,
+        direction: str = "forward"
+    ) -> Optional[asyncio.Task]:
+        """
+        Start prefetch_slices in the background and return immediately.
+
+        When the navigation direction for a file flips, prefetches still
+        running for the old direction are cancelled, since the user has
+        moved away from those slices.
+
+        Args:
+            file_id: Medical image file ID
+            source: The file and window the viewer reads slices with
+            current_slice: Current slice index being viewed
+            total_slices: Total number of slices in volume
+            direction: Navigation direction: "forward" | "backward" | "both"
+
+        Returns:
+            The prefetch task, or None if prefetching is disabled
+        """
+        if not self.enabled:
+            return None
+
+        tasks = _inflight.setdefault(file_id, set())
+        if _last_direction.get(file_id, direction) != direction:
+            for stale in tasks:
+                stale.cancel()
+            logger.debug(
+                f"Navigation direction changed, cancelled {len(tasks)} prefetch(es)",
+                extra={"file_id": file_id, "direction": direction}
+            )
+        _last_direction[file_id] = direction
+
+        task = asyncio.create_task(
+            self.prefetch_slices(file_id, source, current_slice, total_slices, direction),
+            name=f"prefetch:{file_id}:{current_slice}"
+        )
+        tasks.add(task)
+        task.add_done_callback(partial(_forget_task, file_id))
+        return task
+
     async def prefetch_slices(
         self,
         file_id: str,
+        source: SliceSource,
         current_slice: int,
         total_slices: int,
         direction: str = "forward"
@@ -81,6 +241,7 @@ class PrefetchService:
 
         Args:
             file_id: Medical image file ID
+            source: The file and window the viewer reads slices with
             current_slice: Current slice index being viewed
             total_slices: Total number of slices in volume
             direction: Navigation direction: "forward" | "backward" | "both"
@@ -92,20 +253,27 @@ class PrefetchService:
             logger.debug("Prefetching is disabled")
             return 0
 
-        # Calculate which slices to prefetch
+        # Calculate which slices to prefetch from this file's recent navigation
+        session = _sessions.get(file_id)
+        session.history.append(current_slice)
+
         indices_to_prefetch = self._calculate_prefetch_indices(
-            current_slice, total_slices, direction
+            current_slice, total_slices, direction, session.history, session.window
         )
 
         if not indices_to_prefetch:
-            logger.debug(f"No slices to prefetch for {file_id}:{current_slice}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"No slices to prefetch for {file_id}:{current_slice}")
             return 0
 
         # Filter out already cached slices
-        uncached_indices = await self._filter_uncached_slices(file_id, indices_to_prefetch)
+        uncached_indices = await self._filter_uncached_slices(
+            file_id, source, indices_to_prefetch
+        )
 
         if not uncached_indices:
-            logger.debug(f"All prefetch slices already cached for {file_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"All prefetch slices already cached for {file_id}")
             return 0
 
         logger.info(
@@ -118,34 +286,70 @@ class PrefetchService:
             }
         )
 
-        # Prefetch in background (fire-and-forget)
+        # Factories rather than coroutines, so nothing starts before its slot
         tasks = [
-            self._prefetch_single_slice(file_id, idx)
+            partial(self._prefetch_single_slice, source, idx)
             for idx in uncached_indices
         ]
 
-        # Execute with rate limiting based on priority
-        results = await self._execute_with_rate_limit(tasks)
-
-        success_count = sum(1 for r in results if r is True)
+        # Execute concurrently, bounded by priority. Record each slice as it
+        # lands: the viewer may reach it before the rest of the batch is done,
+        # and the pollution feedback must already know it was prefetched.
+        success_count = 0
+        async for position, result in self._stream_with_concurrency(tasks):
+            if result is True:
+                success_count += 1
+                _sessions.record_prefetched(file_id, [uncached_indices[position]])
 
         logger.info(
             "Prefetch completed",
             extra={
                 "file_id": file_id,
                 "success": success_count,
-                "failed": len(results) - success_count,
-                "total": len(results)
+                "failed": len(tasks) - success_count,
+                "total": len(tasks)
             }
         )
 
         return success_count
 
+    @staticmethod
+    def _predict_stride(history: Sequence[int]) -> Optional[int]:
+        """
+        Infer the navigation stride from recently viewed slice indices.
+
+        Args:
+            history: Recent slice indices, oldest first
+
+        Returns:
+            The signed stride when recent moves agree (+/-1 when they agree
+            only on direction), 0 when they change direction (no reliable
+            prediction), or None when there is not enough history
+        """
+        positions = list(history)
+        # Re-requests of the same slice (e.g. window/level changes) aren't moves
+        moves = [b - a for a, b in zip(positions, positions[1:]) if b != a]
+
+        if len(moves) < 2:
+            return None
+
+        if all(move == moves[0] for move in moves) and abs(moves[0]) <= _MAX_PREDICTED_STRIDE:
+            return moves[0]
+
+        if all(move > 0 for move in moves):
+            return 1
+        if all(move < 0 for move in moves):
+            return -1
+
+        return 0
+
     def _calculate_prefetch_indices(
         self,
         current: int,
         total: int,
-        direction: str
+        direction: str,
+        history: Optional[Sequence[int]] = None,
+        window: Optional[int] = None
     ) -> List[int]:
         """
         Calculate which slice indices to prefetch.
@@ -153,32 +357,40 @@ class PrefetchService:
         Args:
             current: Current slice index
             total: Total number of slices
-            direction: Direction of navigation
+            direction: Direction of navigation (used until history shows a pattern)
+            history: Recently viewed slice indices for this file, oldest first
+            window: The file's adaptive prefetch window, capping the count
 
         Returns:
             List of slice indices to prefetch
         """
+        count = self.prefetch_count if window is None else min(self.prefetch_count, window)
+        stride = self._predict_stride(history) if history else None
+
+        if stride == 0:
+            # Erratic navigation: prefetching would mostly pollute the cache
+            return []
+
+        if stride is not None:
+            indices = [current + stride * i for i in range(1, count + 1)]
+            return [idx for idx in indices if 0 <= idx < total]
+
         indices = []
 
         if direction in ("forward", "both"):
-            # Prefetch ahead (N+1, N+2, N+3, ...)
-            for i in range(1, self.prefetch_count + 1):
-                idx = current + i
-                if 0 <= idx < total:
-                    indices.append(idx)
+            # Prefetch ahead (N+1, N+2, N+3, ...); range clamps to [0, total)
+            indices.extend(range(max(current + 1, 0), min(current + count + 1, total)))
 
         if direction in ("backward", "both"):
-            # Prefetch behind (N-1, N-2, N-3, ...)
-            for i in range(1, self.prefetch_count + 1):
-                idx = current - i
-                if 0 <= idx < total:
-                    indices.append(idx)
+            # Prefetch behind (N-1, N-2, N-3, ...), nearest first
+            indices.extend(range(min(current, total) - 1, max(current - count, 0) - 1, -1))
 
         return indices
 
     async def _filter_uncached_slices(
         self,
         file_id: str,
+        source: SliceSource,
         indices: List[int]
     ) -> List[int]:
         """
@@ -186,106 +398,198 @@ class PrefetchService:
 
         Args:
             file_id: File ID
+            source: The file and window whose rendered slices are checked
             indices: List of slice indices to check
 
         Returns:
             List of uncached slice indices
         """
-        uncached = []
+        # Check all slices in one round trip
+        cache_keys = [source.cache_key(idx) for idx in indices]
+        cached = await self.cache_service.exists_many(cache_keys)
 
-        # Check cache for each slice
-        for idx in indices:
-            cache_key = f"slice:{file_id}:{idx}"
+        uncached = [idx for idx, exists in zip(indices, cached) if not exists]
 
-            # Check if exists in cache
-            exists = await self.cache_service.exists(cache_key)
+        # Runs on every prefetch: skip formatting the record unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Filtered uncached slices: {len(uncached)}/{len(indices)}",
+                extra={
+                    "file_id": file_id,
+                    "total_checked": len(indices),
+                    "uncached": len(uncached)
+                }
+            )
 
-            if not exists:
-                uncached.append(idx)
+        return uncached
 
-        logger.debug(
-            f"Filtered uncached slices: {len(uncached)}/{len(indices)}",
-            extra={
-                "file_id": file_id,
-                "total_checked": len(indices),
-                "uncached": len(uncached)
-            }
-        )
+    def effective_prefetch_count(self, file_id: str) -> int:
+        """Slices to prefetch for a file: the configured count, shrunk under cache pollution."""
+        return min(self.prefetch_count, _sessions.get(file_id).window)
 
-        return uncached
+    def report_access(self, file_id: str, slice_index: int, was_hit: bool) -> None:
+        """
+        Report whether a viewed slice was found in the cache.
+
+        Only slices this process prefetched count: a miss means the prefetch
+        was evicted before use and shrinks the file's prefetch window, a hit
+        grows it back.
 
-    async def _prefetch_single_slice(self, file_id: str, slice_index: int) -> bool:
+        Args:
+            file_id: File ID
+            slice_index: Viewed slice index
+            was_hit: Whether the slice was served from cache
+        """
+        _sessions.report_access(file_id, slice_index, was_hit)
+
+    async def _prefetch_single_slice(self, source: SliceSource, slice_index: int) -> bool:
         """
         Prefetch a single slice (low priority background operation).
 
         Args:
-            file_id: File ID
+            source: The file and window to render the slice with
             slice_index: Slice index to prefetch
 
+        Returns:
+            True if successful, False otherwise
+        """
+        key = source.cache_key(slice_index)
+        pending = _inflight_slices.get(key)
+        if pending is not None:
+            # Shield: cancelling this waiter must not cancel the shared load
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_slices[key] = future
+        try:
+            result = await self._fetch_slice(source, slice_index)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                # The load was cancelled; waiters see it as not prefetched
+                future.set_result(False)
+            del _inflight_slices[key]
+
+    async def _fetch_slice(self, source: SliceSource, slice_index: int) -> bool:
+        """
+        Load a single slice so it gets cached.
+
+        Args:
+            source: The file and window to render the slice with
+            slice_index: Slice index to load
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Get slice - this will automatically cache it via ImagingService
-            slice_data = await self.imaging_service.get_slice(
-                file_id=file_id,
-                slice_index=slice_index,
-                normalize=True
+            # Render through ImagingService, which caches it under
+            # source.cache_key(slice_index) - the key the slice route reads
+            slice_data, _ = await self.imaging_service.get_slice_from_source(
+                source=source,
+                slice_index=slice_index
             )
 
             if slice_data is not None:
-                logger.debug(
-                    f"Prefetched slice: {file_id}:{slice_index}",
-                    extra={
-                        "file_id": file_id,
-                        "slice_index": slice_index,
-                        "shape": slice_data.shape if hasattr(slice_data, 'shape') else None
-                    }
-                )
+                # Runs for every prefetched slice: skip building the record
+                # unless debug logging is actually on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Prefetched slice: {source.filename}:{slice_index}",
+                        extra={
+                            "file_name": source.filename,
+                            "slice_index": slice_index
+                        }
+                    )
                 return True
             else:
-                logger.warning(f"Prefetch returned None for {file_id}:{slice_index}")
+                logger.warning(f"Prefetch returned None for {source.filename}:{slice_index}")
                 return False
 
         except Exception as e:
             logger.warning(
-                f"Prefetch failed for {file_id}:{slice_index}",
+                f"Prefetch failed for {source.filename}:{slice_index}",
                 extra={
-                    "file_id": file_id,
+                    "file_name": source.filename,
                     "slice_index": slice_index,
                     "error": str(e)
                 }
             )
             return False
 
-    async def _execute_with_rate_limit(self, tasks: List) -> List:
+    async def _execute_with_concurrency(
+        self,
+        tasks: List[Callable[[], Awaitable]]
+    ) -> List:
         """
-        Execute tasks with rate limiting based on priority.
+        Execute tasks concurrently, bounded by priority.
+
+        Slice loads are I/O-bound, so overlapping them (rather than spacing
+        them out) is what shortens a prefetch; the priority caps how many
+        run at once.
 
         Args:
-            tasks: List of async tasks to execute
+            tasks: Callables returning the coroutines to execute
 
         Returns:
-            List of results
+            List of results, in task order
         """
-        delay = self._priority_delays.get(self.priority, 0.2)
-        results = []
+        if len(tasks) <= 1:
+            # Nothing to overlap: skip the semaphore and gather
+            results = []
+            for task in tasks:
+                try:
+                    results.append(await task())
+                except Exception as exc:
+                    results.append(exc)
+            return results
 
-        for task in tasks:
-            # Execute task
-            result = await task
+        semaphore = asyncio.Semaphore(self._concurrency)
 
-            results.append(result)
+        async def run(task):
+            async with semaphore:
+                return await task()
 
-            # Rate limiting (except for last task)
-            if task != tasks[-1]:
-                await asyncio.sleep(delay)
+        return await asyncio.gather(*(run(task) for task in tasks), return_exceptions=True)
 
-        return results
+    async def _stream_with_concurrency(
+        self,
+        tasks: List[Callable[[], Awaitable]]
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Execute tasks like _execute_with_concurrency, yielding as each finishes.
+
+        Lets callers act on a result as soon as it lands instead of waiting
+        for the slowest task. Tasks still running when the consumer stops
+        (e.g. a cancelled prefetch) are cancelled.
+
+        Args:
+            tasks: Callables returning the coroutines to execute
+
+        Yields:
+            (task position, result or exception), in completion order
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run(position, task):
+            async with semaphore:
+                try:
+                    return position, await task()
+                except Exception as exc:
+                    return position, exc
+
+        running = [asyncio.ensure_future(run(position, task)) for position, task in enumerate(tasks)]
+        try:
+            for next_done in asyncio.as_completed(running):
+                yield await next_done
+        finally:
+            for future in running:
+                future.cancel()
 
     async def prefetch_range(
         self,
         file_id: str,
+        source: SliceSource,
         start_slice: int,
         end_slice: int
     ) -> Dict[str, int]:
@@ -296,6 +600,7 @@ class PrefetchService:
 
         Args:
             file_id: File ID
+            source: The file and window to render the slices with
             start_slice: Start slice index (inclusive)
             end_slice: End slice index (inclusive)
 
@@ -318,15 +623,15 @@ class PrefetchService:
         )
 
         # Filter uncached
-        uncached_indices = await self._filter_uncached_slices(file_id, indices)
+        uncached_indices = await self._filter_uncached_slices(file_id, source, indices)
 
         # Prefetch
         tasks = [
-            self._prefetch_single_slice(file_id, idx)
+            partial(self._prefetch_single_slice, source, idx)
             for idx in uncached_indices
         ]
 
-        results = await self._execute_with_rate_limit(tasks)
+        results = await self._execute_with_concurrency(tasks)
 
         success = sum(1 for r in results if r is True)
         failed = len(results) - success
@@ -366,6 +671,26 @@ class PrefetchService:
                 logger.debug(f"Metadata already cached for {file_id}")
                 return True
 
+        except Exception as e:
+            logger.error(
+                f"Metadata prefetch failed for {file_id}",
+                extra={"file_id": file_id, "error": str(e)}
+            )
+            return False
+
+        return await self._fetch_metadata(file_id)
+
+    async def _fetch_metadata(self, file_id: str) -> bool:
+        """
+        Load a file's metadata so it gets cached.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            True if successful
+        """
+        try:
             # Fetch metadata (will cache automatically)
             metadata = await self.imaging_service.get_file_metadata(file_id)
 
@@ -383,7 +708,83 @@ class PrefetchService:
             )
             return False
 
-    def get_stats(self) -> Dict[str, any]:
+    async def probe_study(
+        self,
+        file_id: str,
+        source: SliceSource,
+        slice_indices: List[int]
+    ) -> Tuple[bool, List[int]]:
+        """
+        Check metadata and slices of a file in one cache round trip.
+
+        Args:
+            file_id: File ID
+            source: The file and window whose rendered slices are checked
+            slice_indices: Slice indices to check
+
+        Returns:
+            Tuple of (metadata cached, uncached slice indices)
+        """
+        cache_keys = [f"metadata:{file_id}"] + [source.cache_key(idx) for idx in slice_indices]
+        cached = await self.cache_service.exists_many(cache_keys)
+
+        uncached = [idx for idx, exists in zip(slice_indices, cached[1:]) if not exists]
+        return cached[0], uncached
+
+    async def prefetch_study(
+        self,
+        file_id: str,
+        source: SliceSource,
+        slice_indices: List[int]
+    ) -> Dict[str, int]:
+        """
+        Warm the cache for a file being opened: metadata plus initial slices.
+
+        One probe covers the metadata and every slice, then the missing
+        metadata and slices are loaded concurrently.
+
+        Args:
+            file_id: File ID
+            source: The file and window to render the slices with
+            slice_indices: Slice indices to warm (e.g. the first visible ones)
+
+        Returns:
+            Dictionary with metadata flag and slice success/failed counts
+        """
+        if not self.enabled:
+            return {"metadata": 0, "success": 0, "failed": 0}
+
+        metadata_cached, uncached_indices = await self.probe_study(file_id, source, slice_indices)
+
+        tasks = [
+            partial(self._prefetch_single_slice, source, idx)
+            for idx in uncached_indices
+        ]
+        if metadata_cached:
+            metadata_ok, results = True, await self._execute_with_concurrency(tasks)
+        else:
+            metadata_ok, results = await asyncio.gather(
+                self._fetch_metadata(file_id),
+                self._execute_with_concurrency(tasks)
+            )
+
+        _sessions.record_prefetched(
+            file_id, [idx for idx, r in zip(uncached_indices, results) if r is True]
+        )
+        success = sum(1 for r in results if r is True)
+
+        logger.info(
+            f"Study prefetch completed for {file_id}",
+            extra={
+                "metadata_cached": metadata_cached,
+                "success": success,
+                "failed": len(results) - success
+            }
+        )
+
+        return {"metadata": int(metadata_ok), "success": success, "failed": len(results) - success}
+
+    def get_stats(self) -> Dict[str, Any]:
         """
         Get prefetch service statistics.
 
@@ -393,6 +794,8 @@ class PrefetchService:
         return {
             "enabled": self.enabled,
             "prefetch_count": self.prefetch_count,
+            "tracked_files": len(_sessions),
+            "pollution_events": _sessions.pollution_events,
             "priority": self.priority,
-            "priority_delay_ms": self._priority_delays.get(self.priority, 0) * 1000
+            "max_concurrency": self._concurrency
         }
@@ -6,13 +6,15 @@ Uses Firestore for metadata persistence and GCS for mask storage.
 This ensures segmentation data survives Cloud Run instance restarts.
 """
 
+import asyncio
 import numpy as np
 import io
 import base64
 import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime, timedelta
 from PIL import Image
 import uuid
@@ -20,6 +22,7 @@ import pydicom
 from pydicom.dataset import Dataset, FileDataset
 from pydicom.uid import generate_uid
 import nibabel as nib
+from nibabel.filebasedimages import ImageFileError
 
 from google.cloud import storage as gcs_storage
 
@@ -55,6 +58,23 @@ logger = get_logger(__name__)
 # Firestore collection name for segmentations
 SEGMENTATIONS_COLLECTION = "segmentations"
 
+# Parallel GCS requests when writing or reading per-slice mask shards
+_SLICE_IO_WORKERS = 16
+
+# Size of a NIfTI-2 header block (NIfTI-1 headers are 348 bytes)
+_NIFTI2_HEADER_SIZE = 540
+
+# Scheduled paint-stroke flushes per segmentation. Module-level so shutdown
+# can wait for them without instantiating the (lazily loaded) service.
+_pending_flushes: Dict[str, asyncio.Task] = {}
+
+
+async def wait_for_pending_flushes() -> None:
+    """Wait for scheduled paint-stroke flushes to finish (application shutdown)."""
+    tasks = list(_pending_flushes.values())
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class SegmentationService:
     """Service for managing medical image segmentations (v1 API).
@@ -86,6 +106,10 @@ class SegmentationService:
         # In-memory cache: {segmentation_id: {metadata, masks_3d, dirty_slices}}
         self.segmentations_cache: Dict[str, Dict] = {}
 
+        # Serializes saves of a segmentation so an older snapshot never
+        # lands after a newer one
+        self._save_locks: Dict[str, asyncio.Lock] = {}
+
         # Firestore client (lazy initialization)
         self._db = None
 
@@ -237,32 +261,78 @@ class SegmentationService:
             await self.cache.delete(cache_key)
             logger.debug(f"Invalidated cache for segmentation slice: {segmentation_id}:{stroke.slice_index}")
 
-        # IMPORTANT: Save immediately to persist across Cloud Run instance restarts
-        # Without this, paint strokes are lost when requests go to different instances
-        # NOTE: This is SYNCHRONOUS to ensure data is persisted before returning
-        # The frontend depends on this to know when it's safe to change slices
+        # Coalesce saves: every stroke used to re-upload the whole volume.
+        # Mark the slice dirty and flush once the debounce window closes;
+        # the frontend calls save_segmentation_async (changing slices,
+        # "Save", closing the viewer) to persist immediately.
+        seg_data.setdefault("dirty_slices", set()).add(stroke.slice_index)
+        self._schedule_flush(segmentation_id)
+
+        return True
+
+    def _schedule_flush(self, segmentation_id: str) -> None:
+        """Schedule a debounced save unless one is already pending."""
+        if segmentation_id in _pending_flushes:
+            return
+
+        # The task removes itself once the window closes; an explicit save
+        # removes and cancels it before then
+        _pending_flushes[segmentation_id] = asyncio.create_task(
+            self._debounced_flush(segmentation_id),
+            name=f"segmentation-flush:{segmentation_id}"
+        )
+
+    async def _debounced_flush(self, segmentation_id: str) -> None:
+        """Wait out the debounce window, then save the accumulated strokes."""
+        await asyncio.sleep(self.settings.SEG_FLUSH_DEBOUNCE_MS / 1000)
+        # Past the window: strokes from now on schedule a new flush, and an
+        # explicit save can no longer cancel this one
+        _pending_flushes.pop(segmentation_id, None)
         try:
-            self._save_segmentation(segmentation_id)
-            logger.info("Paint stroke saved to GCS", extra={
-                "segmentation_id": segmentation_id,
-                "slice_index": stroke.slice_index,
-                "position": {"x": stroke.x, "y": stroke.y}
-            })
+            await self._flush(segmentation_id)
         except Exception as e:
-            logger.error("Failed to save paint stroke to GCS", extra={
+            logger.error("Failed to flush paint strokes", extra={
                 "error": str(e),
-                "segmentation_id": segmentation_id,
-                "slice_index": stroke.slice_index
+                "segmentation_id": segmentation_id
             })
-            # IMPORTANT: Re-raise the exception so the frontend knows the save failed
-            # This allows the frontend to keep local paints as backup
-            raise SegmentationException(
-                message=f"Failed to persist paint stroke to cloud storage: {str(e)}",
-                error_code="GCS_SAVE_FAILED",
-                details={"segmentation_id": segmentation_id, "slice_index": stroke.slice_index}
-            )
 
-        return True
+    async def _flush(self, segmentation_id: str, full: bool = False) -> None:
+        """
+        Save a segmentation off the event loop, one save at a time per segmentation.
+
+        Args:
+            segmentation_id: Segmentation ID
+            full: Rewrite the whole NIfTI volume instead of only the dirty slices
+        """
+        lock = self._save_locks.setdefault(segmentation_id, asyncio.Lock())
+        async with lock:
+            seg_data = self.segmentations_cache.get(segmentation_id)
+            if seg_data is None:
+                return
+
+            # Strokes painted while saving mark their slices dirty again
+            dirty_slices = seg_data.get("dirty_slices") or set()
+            seg_data["dirty_slices"] = set()
+            try:
+                persisted = await asyncio.to_thread(
+                    self._save_segmentation, segmentation_id, None if full else dirty_slices
+                )
+                if not persisted:
+                    # Only on this instance's local disk, which Cloud Run
+                    # does not keep: retry on the next flush or save
+                    raise SegmentationException(
+                        message="Failed to persist segmentation to cloud storage",
+                        error_code="GCS_SAVE_FAILED",
+                        details={"segmentation_id": segmentation_id}
+                    )
+            except Exception:
+                seg_data["dirty_slices"] |= dirty_slices
+                raise
+
+            logger.info("Paint strokes saved to GCS", extra={
+                "segmentation_id": segmentation_id,
+                "slices": sorted(dirty_slices)
+            })
 
     def _apply_circular_brush(
         self,
@@ -491,8 +561,13 @@ class SegmentationService:
             logger.warning("Segmentation not in cache, nothing to save", extra={"segmentation_id": segmentation_id})
             return False
 
+        # Save now instead of waiting for the debounced flush
+        pending = _pending_flushes.pop(segmentation_id, None)
+        if pending is not None:
+            pending.cancel()
+
         try:
-            self._save_segmentation(segmentation_id)
+            await self._flush(segmentation_id, full=True)
             logger.info("Segmentation saved successfully", extra={"segmentation_id": segmentation_id})
             return True
         except Exception as e:
@@ -535,36 +610,41 @@ class SegmentationService:
         # Convert grayscale to RGB
         overlay_image = np.stack([base_normalized] * 3, axis=-1)
 
-        # Apply each label
-        for label_info in metadata.labels:
-            if label_info.id == 0 or not label_info.visible:
-                continue
-
-            if show_labels is not None and label_info.id not in show_labels:
-                continue
-
-            # Get pixels with this label
-            label_mask = (mask == label_info.id)
-
-            if not np.any(label_mask):
-                continue
-
-            # Parse hex color
-            color_rgb = hex_to_rgb(label_info.color)
-
-            # Blend color with base image using alpha compositing
-            for c in range(3):
-                overlay_image[:, :, c] = np.where(
-                    label_mask,
-                    (1 - label_info.opacity) * overlay_image[:, :, c] + label_info.opacity * color_rgb[c],
-                    overlay_image[:, :, c]
-                )
-
-        # Convert to uint8
-        overlay_image = overlay_image.astype(np.uint8)
+        visible = self._visible_labels(metadata.labels, show_labels)
+        if not visible:
+            return array_to_base64(overlay_image)
+
+        # Per-label color and opacity, indexed by label value; hidden labels
+        # (and background) keep opacity 0 so they leave the base untouched
+        colors = np.zeros((256, 3), dtype=np.float64)
+        opacities = np.zeros(256, dtype=np.float64)
+        for label_id, rgb, opacity in visible:
+            colors[label_id] = rgb
+            opacities[label_id] = opacity
+
+        # Labels never overlap, so one gather + blend over the labelled pixels
+        # replaces a per-label, per-channel pass over the whole frame
+        labelled = opacities[mask] > 0
+        label_values = mask[labelled]
+        alpha = opacities[label_values][:, None]
+        overlay_image[labelled] = (1 - alpha) * overlay_image[labelled] + alpha * colors[label_values]
 
         return array_to_base64(overlay_image)
 
+    @staticmethod
+    def _visible_labels(
+        labels: List[LabelInfo],
+        show_labels: Optional[List[int]] = None
+    ) -> List[Tuple[int, Tuple[int, int, int], float]]:
+        """(id, RGB color, opacity) of the labels to draw, skipping background and hidden ones."""
+        return [
+            (label_info.id, hex_to_rgb(label_info.color), label_info.opacity)
+            for label_info in labels
+            if label_info.id != 0
+            and label_info.visible
+            and (show_labels is None or label_info.id in show_labels)
+        ]
+
     async def generate_segmentation_overlay(
         self,
         segmentation_id: str,
@@ -596,42 +676,37 @@ class SegmentationService:
             empty = np.zeros((10, 10, 4), dtype=np.uint8)
             return array_to_base64(empty)
 
-        # Create RGBA image (transparent background)
-        height, width = mask.shape
-        overlay_image = np.zeros((height, width, 4), dtype=np.uint8)
+        visible = self._visible_labels(metadata.labels, show_labels)
+        if not visible:
+            return array_to_base64(np.zeros((*mask.shape, 4), dtype=np.uint8))
 
-        # Apply each label with transparency
-        for label_info in metadata.labels:
-            if label_info.id == 0 or not label_info.visible:
-                continue
+        # RGBA per label value; background and hidden labels stay fully
+        # transparent
+        palette = np.zeros((256, 4), dtype=np.uint8)
+        for label_id, rgb, opacity in visible:
+            palette[label_id] = (*rgb, int(opacity * 255))
 
-            if show_labels is not None and label_info.id not in show_labels:
-                continue
-
-            # Get mask for this label
-            label_mask = (mask == label_info.id)
-            if not label_mask.any():
-                continue
-
-            # Get RGB color
-            rgb = hex_to_rgb(label_info.color)
-
-            # Apply color with alpha
-            alpha = int(label_info.opacity * 255)
-            overlay_image[label_mask, 0] = rgb[0]  # R
-            overlay_image[label_mask, 1] = rgb[1]  # G
-            overlay_image[label_mask, 2] = rgb[2]  # B
-            overlay_image[label_mask, 3] = alpha   # A
+        # One gather through the mask instead of a pass per label (np.take
+        # is several times faster than fancy indexing for this)
+        overlay_image = np.take(palette, mask, axis=0)
 
         return array_to_base64(overlay_image)
 
-    def _save_segmentation(self, segmentation_id: str):
+    def _save_segmentation(self, segmentation_id: str, dirty_slices: Optional[Set[int]] = None) -> bool:
         """Save segmentation to Firestore (metadata) and GCS (masks).
 
         This ensures persistence across Cloud Run instance restarts.
+
+        Args:
+            segmentation_id: Segmentation ID
+            dirty_slices: Only upload these slices, as per-slice shards. None
+                rewrites the full NIfTI volume and folds the shards into it.
+
+        Returns:
+            True if saved to Firestore/GCS, False if it fell back to local disk
         """
         if segmentation_id not in self.segmentations_cache:
-            return
+            return True
 
         seg_data = self.segmentations_cache[segmentation_id]
         masks_3d = seg_data["masks_3d"]
@@ -651,6 +726,8 @@ class SegmentationService:
 
         # Add image shape info
         metadata_dict["mask_shape"] = list(masks_3d.shape)
+        if seg_data.get("nifti_reference") is not None:
+            metadata_dict["nifti_reference"] = seg_data["nifti_reference"]
 
         try:
             # Save metadata to Firestore
@@ -658,13 +735,20 @@ class SegmentationService:
             doc_ref.set(metadata_dict)
             logger.info("Saved segmentation metadata to Firestore", extra={"segmentation_id": segmentation_id})
 
-            # Save masks to GCS as compressed numpy array
-            self._save_masks_to_gcs(segmentation_id, masks_3d)
+            if dirty_slices is not None:
+                # Upload only what changed; the NIfTI is rewritten on an explicit save
+                self._save_dirty_slices_to_gcs(segmentation_id, masks_3d, dirty_slices)
+            else:
+                self._save_masks_to_gcs(segmentation_id, masks_3d)
+                self._delete_slice_shards(segmentation_id)
+
+            return True
 
         except Exception as e:
             logger.error("Failed to save to Firestore/GCS, falling back to local", extra={"error": str(e)})
             # Fallback to local storage
             self._save_segmentation_local(segmentation_id, masks_3d, metadata, source_format)
+            return False
 
     def _save_masks_to_gcs(self, segmentation_id: str, masks_3d: np.ndarray):
         """Save mask data to Google Cloud Storage as NIfTI format (.nii.gz).
@@ -677,53 +761,9 @@ class SegmentationService:
         import os
 
         try:
-            # Get file_id from segmentation metadata to load original image
+            # Affine/header of the original MRI (downloaded once per segmentation)
             seg_data = self.segmentations_cache.get(segmentation_id)
-            file_id = seg_data["metadata"].file_id if seg_data else None
-
-            # Try to get affine and header from original MRI image
-            affine = None
-            header = None
-            original_shape = None
-
-            if file_id:
-                try:
-                    # Download original NIfTI from GCS to get its affine/header
-                    original_blob = self.gcs_bucket.blob(file_id)
-                    if original_blob.exists():
-                        buffer = io.BytesIO()
-                        original_blob.download_to_file(buffer)
-                        buffer.seek(0)
-                        file_bytes = buffer.read()
-
-                        # Detect file type from extension and magic bytes
-                        is_gzipped = file_bytes[:2] == b'\x1f\x8b'
-                        if file_id.endswith('.nii.gz') or is_gzipped:
-                            suffix = '.nii.gz'
-                        else:
-                            suffix = '.nii'
-
-                        # Load original NIfTI to get affine and header
-                        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                            tmp.write(file_bytes)
-                            tmp_path = tmp.name
-
-                        original_nifti = nib.load(tmp_path)
-                        affine = original_nifti.affine.copy()
-                        header = original_nifti.header.copy()
-                        original_shape = original_nifti.shape
-                        os.unlink(tmp_path)
-
-                        logger.info("Loaded affine/header from original MRI", extra={
-                            "file_id": file_id,
-                            "original_shape": original_shape,
-                            "original_affine_diag": [affine[0,0], affine[1,1], affine[2,2]],
-                            "voxel_sizes": list(header.get_zooms()[:3])
-                        })
-                    else:
-                        logger.warning("Original MRI file not found, using identity affine", extra={"file_id": file_id})
-                except Exception as e:
-                    logger.warning("Could not load original MRI affine/header", extra={"error": str(e), "file_id": file_id})
+            affine, header, original_shape = self._get_nifti_reference(seg_data)
 
             # Create segmentation data with EXACT same shape as original MRI
             if original_shape is not None:
@@ -803,6 +843,165 @@ class SegmentationService:
             logger.error("Failed to save masks to GCS", extra={"error": str(e)})
             raise
 
+    def _get_nifti_reference(
+        self,
+        seg_data: Optional[Dict]
+    ) -> Tuple[Optional[np.ndarray], Optional[Any], Optional[Tuple[int, ...]]]:
+        """Return the original MRI's affine, header and shape for aligning the mask NIfTI.
+
+        Read from the original image once, then kept in the cache entry and
+        persisted with the Firestore metadata, so later saves skip downloading
+        the full original volume.
+        """
+        if not seg_data:
+            return None, None, None
+
+        reference = seg_data.get("nifti_reference")
+        if reference is None:
+            reference = self._read_nifti_reference(seg_data["metadata"].file_id)
+            if reference is None:
+                # Transient failure: try again on the next save
+                return None, None, None
+            seg_data["nifti_reference"] = reference
+
+        if not reference:
+            return None, None, None
+
+        header_block = base64.b64decode(reference["header"])
+        header_class = nib.Nifti2Header if len(header_block) == _NIFTI2_HEADER_SIZE else nib.Nifti1Header
+        affine = np.array(reference["affine"], dtype=np.float64).reshape(4, 4)
+        return affine, header_class(binaryblock=header_block), tuple(reference["shape"])
+
+    def _read_nifti_reference(self, file_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Download the original MRI and extract what the mask NIfTI needs from it.
+
+        Returns:
+            {"affine": 16 floats (Firestore has no nested arrays), "header":
+            base64 header block, "shape": list}; {} if the original is missing
+            or not a NIfTI; None if it could not be read right now
+        """
+        import tempfile
+        import os
+
+        if not file_id:
+            return {}
+
+        try:
+            # Download original NIfTI from GCS to get its affine/header
+            original_blob = self.gcs_bucket.blob(file_id)
+            if not original_blob.exists():
+                logger.warning("Original MRI file not found, using identity affine", extra={"file_id": file_id})
+                return {}
+
+            buffer = io.BytesIO()
+            original_blob.download_to_file(buffer)
+            file_bytes = buffer.getvalue()
+
+            # Detect file type from extension and magic bytes
+            is_gzipped = file_bytes[:2] == b'\x1f\x8b'
+            if file_id.endswith('.nii.gz') or is_gzipped:
+                suffix = '.nii.gz'
+            else:
+                suffix = '.nii'
+
+            # Load original NIfTI to get affine and header
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                tmp.write(file_bytes)
+                tmp_path = tmp.name
+
+            try:
+                original_nifti = nib.load(tmp_path)
+                affine = original_nifti.affine
+                header = original_nifti.header
+                original_shape = original_nifti.shape
+            finally:
+                os.unlink(tmp_path)
+
+            logger.info("Loaded affine/header from original MRI", extra={
+                "file_id": file_id,
+                "original_shape": original_shape,
+                "original_affine_diag": [affine[0,0], affine[1,1], affine[2,2]],
+                "voxel_sizes": list(header.get_zooms()[:3])
+            })
+            return {
+                "affine": [float(value) for value in affine.ravel()],
+                "header": base64.b64encode(header.binaryblock).decode("ascii"),
+                "shape": [int(dim) for dim in original_shape]
+            }
+        except ImageFileError:
+            logger.warning("Original image is not a NIfTI, using identity affine", extra={"file_id": file_id})
+            return {}
+        except Exception as e:
+            logger.warning("Could not load original MRI affine/header", extra={"error": str(e), "file_id": file_id})
+            return None
+
+    def _save_dirty_slices_to_gcs(self, segmentation_id: str, masks_3d: np.ndarray, dirty_slices: Set[int]):
+        """Upload changed slices to GCS as compressed per-slice shards, in parallel.
+
+        Shards use the layout of the v2 service (slices/slice_NNNN.npz) and
+        override the matching slices of masks.nii.gz when loading, until the
+        next full save folds them into the NIfTI.
+        """
+        def upload(slice_idx: int):
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, mask=masks_3d[slice_idx])
+            buffer.seek(0)
+            blob = self.gcs_bucket.blob(f"segmentations/{segmentation_id}/slices/slice_{slice_idx:04d}.npz")
+            blob.upload_from_file(buffer, content_type="application/octet-stream")
+
+        slice_indices = sorted(dirty_slices)
+        if not slice_indices:
+            return
+        with ThreadPoolExecutor(max_workers=min(_SLICE_IO_WORKERS, len(slice_indices))) as executor:
+            # list() re-raises the first upload failure
+            list(executor.map(upload, slice_indices))
+
+        seg_data = self.segmentations_cache.get(segmentation_id)
+        if seg_data is not None:
+            seg_data.setdefault("slice_shards", set()).update(slice_indices)
+
+        logger.info("Saved dirty slices to GCS", extra={"segmentation_id": segmentation_id, "slices": slice_indices})
+
+    def _delete_slice_shards(self, segmentation_id: str):
+        """Delete the slice shards a full NIfTI save has just absorbed."""
+        seg_data = self.segmentations_cache.get(segmentation_id)
+        shards = seg_data.pop("slice_shards", None) if seg_data else None
+        if not shards:
+            return
+
+        blobs = [
+            self.gcs_bucket.blob(f"segmentations/{segmentation_id}/slices/slice_{slice_idx:04d}.npz")
+            for slice_idx in shards
+        ]
+        # A shard left behind only repeats data the NIfTI already holds
+        self.gcs_bucket.delete_blobs(blobs, on_error=lambda blob: None)
+
+    def _apply_slice_shards(self, segmentation_id: str, masks_3d: np.ndarray) -> Set[int]:
+        """Overlay slice shards saved since the last full save onto loaded masks.
+
+        Returns:
+            Indices of the applied shards
+        """
+        prefix = f"segmentations/{segmentation_id}/slices/"
+        blobs = [blob for blob in self.gcs_bucket.list_blobs(prefix=prefix) if blob.name.endswith(".npz")]
+        if not blobs:
+            return set()
+
+        def download(blob):
+            slice_idx = int(blob.name.rsplit("/", 1)[-1].replace("slice_", "").replace(".npz", ""))
+            buffer = io.BytesIO(blob.download_as_bytes())
+            return slice_idx, np.load(buffer)["mask"]
+
+        applied = set()
+        with ThreadPoolExecutor(max_workers=min(_SLICE_IO_WORKERS, len(blobs))) as executor:
+            for slice_idx, mask in executor.map(download, blobs):
+                if slice_idx < masks_3d.shape[0] and mask.shape == masks_3d.shape[1:]:
+                    masks_3d[slice_idx] = mask
+                    applied.add(slice_idx)
+
+        logger.info("Applied slice shards from GCS", extra={"segmentation_id": segmentation_id, "slices": sorted(applied)})
+        return applied
+
     def _load_masks_from_gcs(self, segmentation_id: str) -> Optional[np.ndarray]:
         """Load mask data from Google Cloud Storage (NIfTI or NPZ format)."""
         try:
@@ -814,13 +1013,12 @@ class SegmentationService:
                 # Load NIfTI format
                 buffer = io.BytesIO()
                 nifti_blob.download_to_file(buffer)
-                buffer.seek(0)
 
                 # nibabel needs a file, so use temp file
                 import tempfile
                 import os
                 with tempfile.NamedTemporaryFile(suffix='.nii.gz', delete=False) as tmp:
-                    tmp.write(buffer.read())
+                    tmp.write(buffer.getbuffer())
                     tmp_path = tmp.name
 
                 import nibabel as nib
@@ -855,7 +1053,7 @@ class SegmentationService:
             logger.error("Failed to load masks from GCS", extra={"error": str(e)})
             return None
 
-    def get_segmentation_nifti(self, segmentation_id: str) -> Optional[bytes]:
+    async def get_segmentation_nifti(self, segmentation_id: str) -> Optional[bytes]:
         """Get the segmentation NIfTI file as raw bytes for direct serving.
 
         Returns the NIfTI file (.nii.gz) directly from GCS without any processing.
@@ -869,28 +1067,16 @@ class SegmentationService:
             Raw bytes of the .nii.gz file, or None if not found
         """
         try:
-            # Check GCS for the NIfTI file
-            nifti_blob_path = f"segmentations/{segmentation_id}/masks.nii.gz"
-            nifti_blob = self.gcs_bucket.blob(nifti_blob_path)
-
-            if nifti_blob.exists():
-                buffer = io.BytesIO()
-                nifti_blob.download_to_file(buffer)
-                buffer.seek(0)
-
-                logger.info("Retrieved segmentation NIfTI from GCS", extra={
-                    "segmentation_id": segmentation_id,
-                    "path": nifti_blob_path,
-                    "size_bytes": buffer.getbuffer().nbytes
-                })
-
-                return buffer.read()
+            # Strokes flushed as slice shards are not in the NIfTI yet: fold
+            # them in first so the viewer gets the current mask
+            seg_data = self.segmentations_cache.get(segmentation_id)
+            if seg_data is not None and (seg_data.get("slice_shards") or seg_data.get("dirty_slices")):
+                pending = _pending_flushes.pop(segmentation_id, None)
+                if pending is not None:
+                    pending.cancel()
+                await self._flush(segmentation_id, full=True)
 
-            logger.warning("Segmentation NIfTI not found in GCS", extra={
-                "segmentation_id": segmentation_id,
-                "path": nifti_blob_path
-            })
-            return None
+            return await asyncio.to_thread(self._download_segmentation_nifti, segmentation_id)
 
         except Exception as e:
             logger.error("Failed to get segmentation NIfTI", extra={
@@ -899,6 +1085,29 @@ class SegmentationService:
             })
             return None
 
+    def _download_segmentation_nifti(self, segmentation_id: str) -> Optional[bytes]:
+        """Download masks.nii.gz from GCS, or None if it does not exist."""
+        nifti_blob_path = f"segmentations/{segmentation_id}/masks.nii.gz"
+        nifti_blob = self.gcs_bucket.blob(nifti_blob_path)
+
+        if nifti_blob.exists():
+            buffer = io.BytesIO()
+            nifti_blob.download_to_file(buffer)
+
+            logger.info("Retrieved segmentation NIfTI from GCS", extra={
+                "segmentation_id": segmentation_id,
+                "path": nifti_blob_path,
+                "size_bytes": buffer.getbuffer().nbytes
+            })
+
+            return buffer.getvalue()
+
+        logger.warning("Segmentation NIfTI not found in GCS", extra={
+            "segmentation_id": segmentation_id,
+            "path": nifti_blob_path
+        })
+        return None
+
     def _save_segmentation_local(self, segmentation_id: str, masks_3d: np.ndarray, metadata, source_format: str):
         """Fallback: Save segmentation to local disk."""
         # Save metadata as JSON
@@ -989,6 +1198,7 @@ class SegmentationService:
                 # Extract source_format
                 source_format = metadata_dict.pop('source_format', 'nifti')
                 mask_shape = metadata_dict.pop('mask_shape', None)
+                nifti_reference = metadata_dict.pop('nifti_reference', None)
                 metadata_dict.pop('segmentation_id', None)  # Remove if present
 
                 # Create metadata object
@@ -1003,7 +1213,9 @@ class SegmentationService:
                         "metadata": metadata,
                         "masks_3d": masks_3d,
                         "image_shape": masks_3d.shape,
-                        "source_format": source_format
+                        "source_format": source_format,
+                        "slice_shards": self._apply_slice_shards(segmentation_id, masks_3d),
+                        "nifti_reference": nifti_reference
                     }
                     logger.info("Segmentation loaded from Firestore/GCS", extra={"segmentation_id": segmentation_id})
                     return True
@@ -1020,7 +1232,9 @@ class SegmentationService:
                         "metadata": metadata,
                         "masks_3d": masks_3d,
                         "image_shape": masks_3d.shape,
-                        "source_format": source_format
+                        "source_format": source_format,
+                        "slice_shards": self._apply_slice_shards(segmentation_id, masks_3d),
+                        "nifti_reference": nifti_reference
                     }
                     logger.warning("Masks not found in GCS, using empty", extra={"segmentation_id": segmentation_id})
                     return True
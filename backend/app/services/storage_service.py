@@ -9,7 +9,7 @@ and clinical documents with SHA-256 integrity verification.
 
 import hashlib
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
 from functools import partial
 import logging
@@ -39,6 +39,20 @@ class GCSStorageService(IStorageService):
     with connection pooling and automatic retry.
     """
 
+    # Downloads currently in progress, keyed by (bucket, object).
+    # Class-level because the DI container builds a new instance per request;
+    # concurrent callers for the same object await one shared GCS download.
+    _inflight_downloads: Dict[Tuple[str, str], "asyncio.Future[bytes]"] = {}
+
+    # Initialized clients shared across instances, keyed by credentials path
+    # (None for default credentials): (client, credentials, service_account_email)
+    _client_cache: Dict[Optional[str], Tuple[storage.Client, Any, Optional[str]]] = {}
+
+    # Signed download URLs, keyed by (object, filename, expiration_minutes,
+    # window_start). Expiry is aligned to a window of half the requested
+    # validity, so every caller within a window shares one signed URL.
+    _signed_url_cache: Dict[Tuple[str, Optional[str], int, datetime], SignedUrl] = {}
+
     def __init__(self, credentials_path: Optional[str] = None):
         """
         Initialize GCS client.
@@ -54,8 +68,13 @@ class GCSStorageService(IStorageService):
         self._service_account_email = None
 
     def _get_client(self) -> storage.Client:
-        """Get or create GCS client (lazy initialization)."""
+        """Get or create GCS client (lazy initialization, shared process-wide)."""
         if self._client is None:
+            cached = self._client_cache.get(self._credentials_path)
+            if cached is not None:
+                self._client, self._credentials, self._service_account_email = cached
+                return self._client
+
             try:
                 if self._credentials_path:
                     self._credentials = service_account.Credentials.from_service_account_file(
@@ -91,6 +110,10 @@ class GCSStorageService(IStorageService):
                         project=self._project_id or project
                     )
 
+                self._client_cache[self._credentials_path] = (
+                    self._client, self._credentials, self._service_account_email
+                )
+
                 logger.info(
                     "GCS client initialized",
                     extra={
@@ -220,7 +243,28 @@ class GCSStorageService(IStorageService):
         bucket_name: str,
         object_name: str
     ) -> bytes:
-        """Download file from GCS."""
+        """
+        Download file from GCS.
+
+        Concurrent requests for the same object are coalesced into a single
+        download whose result (or exception) is shared by all callers.
+        """
+        key = (bucket_name, object_name)
+        task = self._inflight_downloads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._download_file(bucket_name, object_name))
+            self._inflight_downloads[key] = task
+            task.add_done_callback(lambda _: self._inflight_downloads.pop(key, None))
+
+        # Shield so a cancelled caller does not abort the download for the others
+        return await asyncio.shield(task)
+
+    async def _download_file(
+        self,
+        bucket_name: str,
+        object_name: str
+    ) -> bytes:
+        """Download file from GCS (uncoalesced)."""
         try:
             client = self._get_client()
             bucket = client.bucket(bucket_name)
@@ -736,13 +780,30 @@ class GCSStorageService(IStorageService):
         expiration_minutes: int = 60,
         filename: Optional[str] = None
     ) -> SignedUrl:
-        """Generate signed download URL for default bucket."""
+        """
+        Generate signed download URL for default bucket.
+
+        The expiry is rounded to a window of half the requested validity and
+        the URL is reused for all calls within that window, so a returned URL
+        is always valid for at least half of ``expiration_minutes``.
+        """
+        expiration = timedelta(minutes=expiration_minutes)
+        window = max(1, expiration_minutes // 2) * 60
+        now = datetime.now(timezone.utc)
+        window_start = datetime.fromtimestamp(
+            int(now.timestamp()) // window * window, tz=timezone.utc
+        )
+        expires_at = window_start + expiration
+
+        cache_key = (object_name, filename, expiration_minutes, window_start)
+        cached = self._signed_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         client = self._get_client()
         bucket = client.bucket(settings.GCS_BUCKET_NAME)
         blob = bucket.blob(object_name)
 
-        expiration = timedelta(minutes=expiration_minutes)
-
         # Add content-disposition header if filename provided
         response_disposition = None
         if filename:
@@ -751,7 +812,7 @@ class GCSStorageService(IStorageService):
         # For Cloud Run, we need to use service_account_email for IAM signing
         sign_kwargs = {
             "version": "v4",
-            "expiration": expiration,
+            "expiration": expires_at,
             "method": "GET",
             "response_disposition": response_disposition,
         }
@@ -770,14 +831,23 @@ class GCSStorageService(IStorageService):
             **sign_kwargs
         )
 
-        expires_at = datetime.now(timezone.utc) + expiration
-
-        return SignedUrl(
+        signed_url = SignedUrl(
             url=url,
             expires_at=expires_at,
             method="GET"
         )
 
+        # Drop entries whose window has passed before adding the new one
+        stale = [
+            key for key in self._signed_url_cache
+            if key[3] + timedelta(minutes=max(1, key[2] // 2)) <= now
+        ]
+        for key in stale:
+            self._signed_url_cache.pop(key, None)
+        self._signed_url_cache[cache_key] = signed_url
+
+        return signed_url
+
     # Aliases for backwards compatibility with study_service
     async def file_exists(self, object_name: str, bucket_name: Optional[str] = None) -> bool:
         """
@@ -1109,6 +1109,7 @@ class StudyServiceFirestore(IStudyService):
         try:
             import pydicom
             from io import BytesIO
+            from app.utils.dicom_utils import get_dicom_float
 
             ds = pydicom.dcmread(BytesIO(file_data))
 
@@ -1123,8 +1124,8 @@ class StudyServiceFirestore(IStudyService):
                 "pixel_spacing": str(ds.PixelSpacing) if hasattr(ds, 'PixelSpacing') else None,
                 "slice_thickness": float(ds.SliceThickness) if hasattr(ds, 'SliceThickness') else None,
                 "slice_location": float(ds.SliceLocation) if hasattr(ds, 'SliceLocation') else None,
-                "window_center": float(ds.WindowCenter) if hasattr(ds, 'WindowCenter') else None,
-                "window_width": float(ds.WindowWidth) if hasattr(ds, 'WindowWidth') else None,
+                "window_center": get_dicom_float(ds, 'WindowCenter'),
+                "window_width": get_dicom_float(ds, 'WindowWidth'),
             }
 
             return metadata
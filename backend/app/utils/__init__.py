@@ -6,6 +6,7 @@ to eliminate code duplication and improve maintainability.
 """
 
 from app.utils.image_utils import (
+    compute_min_max,
     normalize_to_uint8,
     array_to_base64,
     hex_to_rgb,
@@ -19,7 +20,9 @@ from app.utils.image_utils import (
 
 from app.utils.nifti_utils import (
     detect_gzip,
+    detect_nifti,
     load_nifti_from_bytes,
+    open_nifti_from_bytes,
     create_nifti_image,
     save_nifti,
     transpose_for_nifti,
@@ -41,11 +44,13 @@ from app.utils.dicom_utils import (
     numpy_to_dicom_pixel_data,
     save_dicom,
     create_segmentation_dicom,
-    extract_dicom_metadata
+    extract_dicom_metadata,
+    get_dicom_float
 )
 
 __all__ = [
     # image_utils
+    'compute_min_max',
     'normalize_to_uint8',
     'array_to_base64',
     'hex_to_rgb',
@@ -57,7 +62,9 @@ __all__ = [
     'combine_mask_overlays',
     # nifti_utils
     'detect_gzip',
+    'detect_nifti',
     'load_nifti_from_bytes',
+    'open_nifti_from_bytes',
     'create_nifti_image',
     'save_nifti',
     'transpose_for_nifti',
@@ -78,4 +85,5 @@ __all__ = [
     'save_dicom',
     'create_segmentation_dicom',
     'extract_dicom_metadata',
+    'get_dicom_float',
 ]
@@ -8,6 +8,7 @@ code duplication and provide standardized DICOM handling.
 import numpy as np
 import pydicom
 from pydicom.dataset import Dataset, FileDataset
+from pydicom.multival import MultiValue
 from pydicom.uid import generate_uid
 from datetime import datetime
 from typing import Optional, Tuple, Dict, Any
@@ -467,3 +468,36 @@ def extract_dicom_metadata(ds: FileDataset) -> Dict[str, Any]:
         metadata['slice_thickness'] = float(ds.SliceThickness)
 
     return metadata
+
+
+def get_dicom_float(
+    ds: Dataset,
+    keyword: str,
+    default: Optional[float] = None
+) -> Optional[float]:
+    """
+    Read a numeric (DS/IS) element as a float, tolerating multiple values.
+
+    Elements such as WindowCenter and WindowWidth may hold several values
+    (one per VOI LUT window, common in CT); the first one is used. Missing
+    or empty elements return ``default``.
+
+    Args:
+        ds: DICOM dataset
+        keyword: Element keyword (e.g. 'WindowCenter')
+        default: Value returned when the element is missing or empty
+
+    Returns:
+        First value of the element as float, or ``default``
+
+    Examples:
+        >>> ds.WindowCenter = ['40', '400']
+        >>> get_dicom_float(ds, 'WindowCenter')
+        40.0
+    """
+    value = ds.get(keyword)
+    if isinstance(value, MultiValue):
+        value = value[0] if len(value) > 0 else None
+    if value is None or value == '':
+        return default
+    return float(value)
@@ -6,13 +6,83 @@ code duplication between imaging_service and segmentation_service.
 """
 
 import numpy as np
-import base64
 import io
 from typing import Tuple, Optional, Union
 from PIL import Image
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib base64 codec
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    from numba import config as numba_config, njit, prange
+
+    # Parallel kernels run in worker threads (slice renders are offloaded
+    # with asyncio.to_thread). Prefer OpenMP: it is thread-safe, and unlike
+    # TBB it does not hang when its pool is first started off the main thread.
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _min_max_kernel(flat):
+        """Both extrema in one pass; branchless min/max vectorizes for integers."""
+        arr_min = flat[0]
+        arr_max = flat[0]
+        for i in range(flat.shape[0]):
+            arr_min = min(arr_min, flat[i])
+            arr_max = max(arr_max, flat[i])
+        return arr_min, arr_max
+
+    @njit(parallel=True, cache=True)
+    def _scale_to_uint8_kernel(flat, arr_min, arr_max, out):
+        """Fused rescale + uint8 cast, without a float64 copy of the input."""
+        for i in prange(flat.shape[0]):
+            out[i] = np.uint8((float(flat[i]) - arr_min) / (arr_max - arr_min) * 255.0)
+else:
+    _min_max_kernel = None
+    _scale_to_uint8_kernel = None
+
+
+def compute_min_max(array: np.ndarray) -> Tuple[np.generic, np.generic]:
+    """
+    Compute the minimum and maximum of an array.
+
+    Integer arrays are scanned once for both values when Numba is
+    available; other arrays (including floats, to keep NaN semantics)
+    use ``array.min()`` and ``array.max()``.
+
+    Args:
+        array: Non-empty numpy array
+
+    Returns:
+        Tuple of (min, max) as scalars of the array's dtype
+
+    Examples:
+        >>> compute_min_max(np.array([[3, 7], [1, 5]], dtype=np.int16))
+        (1, 7)
+    """
+    if (
+        _min_max_kernel is not None
+        and np.issubdtype(array.dtype, np.integer)
+        and array.dtype.isnative
+        and array.flags.c_contiguous
+        and array.size > 0
+    ):
+        arr_min, arr_max = _min_max_kernel(array.reshape(-1))
+        return array.dtype.type(arr_min), array.dtype.type(arr_max)
+
+    return array.min(), array.max()
+
 
-def normalize_to_uint8(array: np.ndarray) -> np.ndarray:
+def normalize_to_uint8(
+    array: np.ndarray,
+    value_range: Optional[Tuple[float, float]] = None
+) -> np.ndarray:
     """
     Normalize array to 0-255 uint8 range.
 
@@ -21,6 +91,9 @@ def normalize_to_uint8(array: np.ndarray) -> np.ndarray:
 
     Args:
         array: Input numpy array of any dtype
+        value_range: Optional (min, max) to scale against instead of the
+            array's own range, e.g. the range of the whole volume when
+            normalizing a single slice
 
     Returns:
         Normalized array as uint8
@@ -32,13 +105,28 @@ def normalize_to_uint8(array: np.ndarray) -> np.ndarray:
         dtype('uint8')
     """
     # Already uint8, return as-is
-    if array.dtype == np.uint8:
+    if array.dtype == np.uint8 and value_range is None:
         return array
 
+    # Take the range before widening: exact, and cheaper on the narrow dtype
+    if value_range is None:
+        value_range = compute_min_max(array)
+    # As Python floats: the range of a wide int16 volume overflows int16 math
+    arr_min, arr_max = float(value_range[0]), float(value_range[1])
+
+    # numba rejects non-native byte order (big-endian NIfTI); NumPy path below
+    if (
+        _scale_to_uint8_kernel is not None
+        and array.dtype.isnative
+        and arr_max > arr_min
+    ):
+        flat = np.ascontiguousarray(array).reshape(-1)
+        out = np.empty(flat.shape, dtype=np.uint8)
+        _scale_to_uint8_kernel(flat, arr_min, arr_max, out)
+        return out.reshape(array.shape)
+
     # Convert to float for calculation
     array = array.astype(np.float64)
-    arr_min = array.min()
-    arr_max = array.max()
 
     # Normalize to 0-255 range
     if arr_max > arr_min:
@@ -146,10 +234,9 @@ def array_to_base64(
     # Save to buffer as PNG
     buffer = io.BytesIO()
     image.save(buffer, format='PNG')
-    buffer.seek(0)
 
     # Encode to base64
-    img_b64 = base64.b64encode(buffer.read()).decode('utf-8')
+    img_b64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
 
     # Add data URL prefix if requested
     if include_data_url_prefix:
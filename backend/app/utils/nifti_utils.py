@@ -7,10 +7,14 @@ code duplication and provide standardized NIfTI handling.
 
 import numpy as np
 import nibabel as nib
+import gzip
+import io
+import zlib
 import tempfile
 import os
 from typing import Tuple, Optional
 from pathlib import Path
+from nibabel.fileholders import FileHolder
 
 
 def detect_gzip(file_data: bytes) -> bool:
@@ -31,6 +35,36 @@ def detect_gzip(file_data: bytes) -> bool:
     return file_data[:2] == b'\x1f\x8b'
 
 
+def detect_nifti(file_data: bytes) -> bool:
+    """
+    Detect if file data is a NIfTI-1 or NIfTI-2 image by its header magic.
+
+    Only the first 544 bytes of the header are inspected; gzipped data is
+    decompressed just far enough to reach them.
+
+    Args:
+        file_data: Raw file bytes (.nii or .nii.gz)
+
+    Returns:
+        True if the header carries a NIfTI magic string, False otherwise
+
+    Examples:
+        >>> detect_nifti(nifti_bytes)
+        True
+        >>> detect_nifti(b'not an image')
+        False
+    """
+    header = file_data[:544]
+    if detect_gzip(file_data):
+        try:
+            header = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(file_data, 544)
+        except zlib.error:
+            return False
+
+    # NIfTI-1 magic sits at byte 344, NIfTI-2 magic at byte 4
+    return header[344:348] in (b'n+1\x00', b'ni1\x00') or header[4:8] in (b'n+2\x00', b'ni2\x00')
+
+
 def load_nifti_from_bytes(
     file_data: bytes,
     normalize: bool = False
@@ -85,6 +119,38 @@ def load_nifti_from_bytes(
             os.unlink(tmp_path)
 
 
+def open_nifti_from_bytes(file_data: bytes) -> nib.Nifti1Image:
+    """
+    Open a NIfTI image from bytes without reading its voxel data.
+
+    Only the header is parsed; ``img.dataobj`` is an array proxy, so
+    indexing it (e.g. ``img.dataobj[:, :, k]``) reads and scales just the
+    requested voxels. Gzipped data is decompressed as a stream on access.
+
+    Args:
+        file_data: Raw NIfTI file bytes (.nii or .nii.gz)
+
+    Returns:
+        NIfTI image backed by ``file_data``
+
+    Examples:
+        >>> img = open_nifti_from_bytes(data)
+        >>> img.dataobj[:, :, 80].shape
+        (256, 256)
+    """
+    fileobj = io.BytesIO(file_data)
+    if detect_gzip(file_data):
+        fileobj = gzip.GzipFile(fileobj=fileobj, mode='rb')
+
+    # sizeof_hdr, the first int32 in either byte order, is 540 for NIfTI-2
+    sizeof_hdr = fileobj.read(4)
+    fileobj.seek(0)
+    image_class = nib.Nifti2Image if sizeof_hdr in (b'\x1c\x02\x00\x00', b'\x00\x00\x02\x1c') else nib.Nifti1Image
+
+    holder = FileHolder(fileobj=fileobj)
+    return image_class.from_file_map({'header': holder, 'image': holder})
+
+
 def create_nifti_image(
     data: np.ndarray,
     affine: Optional[np.ndarray] = None,
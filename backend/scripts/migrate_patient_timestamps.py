@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Patient Timestamp Migration Script
+
+Converts the ISO-string date fields of Firestore patient documents
+(birth_date, deceased_date, created_at, updated_at) to native Firestore
+Timestamps, the format PatientServiceFirestore now writes.
+
+Until this has run, patients written by older versions keep their string
+values: they still read correctly, but sort apart from migrated documents
+when ordering by created_at (Firestore orders by value type first).
+
+Usage:
+    cd backend
+    python scripts/migrate_patient_timestamps.py --dry-run
+    python scripts/migrate_patient_timestamps.py
+
+Requirements:
+    - Firebase credentials (GOOGLE_APPLICATION_CREDENTIALS or ADC)
+    - Safe to re-run: documents already using Timestamps are skipped
+"""
+
+import argparse
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.firebase import get_firestore_client, Collections  # noqa: E402
+from app.services.patient_service_firestore import _to_timestamp  # noqa: E402
+
+DATE_FIELDS = ("birth_date", "deceased_date")
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+# Firestore accepts at most 500 writes per batch
+BATCH_SIZE = 500
+
+
+def convert_fields(doc_data: dict) -> dict:
+    """Return the fields of a patient document that still hold ISO strings, converted."""
+    updates = {}
+    for field in DATE_FIELDS:
+        value = doc_data.get(field)
+        if isinstance(value, str):
+            updates[field] = _to_timestamp(date.fromisoformat(value))
+    for field in DATETIME_FIELDS:
+        value = doc_data.get(field)
+        if isinstance(value, str):
+            updates[field] = datetime.fromisoformat(value)
+    return updates
+
+
+def migrate(dry_run: bool) -> int:
+    """Migrate all patient documents; returns the number of documents updated."""
+    db = get_firestore_client()
+    batch = db.batch()
+    pending = 0
+    updated = 0
+
+    for doc in db.collection(Collections.PATIENTS).stream():
+        updates = convert_fields(doc.to_dict())
+        if not updates:
+            continue
+
+        updated += 1
+        print(f"{'[dry-run] ' if dry_run else ''}{doc.id}: {', '.join(sorted(updates))}")
+        if dry_run:
+            continue
+
+        batch.update(doc.reference, updates)
+        pending += 1
+        if pending == BATCH_SIZE:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending:
+        batch.commit()
+
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert patient ISO date strings to Firestore Timestamps")
+    parser.add_argument("--dry-run", action="store_true", help="List the documents to migrate without writing")
+    args = parser.parse_args()
+
+    updated = migrate(args.dry_run)
+    action = "would be migrated" if args.dry_run else "migrated"
+    print(f"✅ {updated} patient document(s) {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,21 +4,37 @@ Unit tests for PrefetchService.
 Tests the intelligent prefetching functionality focusing on:
 - Core prefetching logic
 - Cache filtering
-- Rate limiting
+- Bounded concurrency
 - Edge cases
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.services import prefetch_service as prefetch_module
+from app.services.imaging_service import SliceSource
 from app.services.prefetch_service import PrefetchService
 
 
+@pytest.fixture(autouse=True)
+def clear_prefetch_sessions(monkeypatch):
+    """Prefetch sessions are module-level; start each test fresh."""
+    monkeypatch.setattr(prefetch_module, "_sessions", prefetch_module._PrefetchSessions())
+
+
+@pytest.fixture
+def source():
+    """The file and window a viewer reads slices with."""
+    return SliceSource(file_data=b"scan", filename="scan.nii", file_hash="abc123")
+
+
 @pytest.fixture
 def mock_imaging_service():
     """Mock ImagingService."""
     service = AsyncMock()
-    service.get_slice = AsyncMock(return_value={"data": "slice_data"})
+    service.get_slice_from_source = AsyncMock(return_value=({"data": "slice_data"}, False))
     service.get_file_metadata = AsyncMock(return_value={"slices": 100})
     return service
 
@@ -29,6 +45,12 @@ def mock_cache_service():
     service = AsyncMock()
     service.exists = AsyncMock(return_value=False)
     service.set = AsyncMock(return_value=True)
+
+    # Answer batched checks from the per-key mock so tests can drive both
+    async def exists_many(keys):
+        return [await service.exists(key) for key in keys]
+
+    service.exists_many = AsyncMock(side_effect=exists_many)
     return service
 
 
@@ -98,52 +120,163 @@ class TestPrefetchIndexCalculation:
         assert indices == []
 
 
+class TestNavigationPrediction:
+    """Test suite for stride/direction prediction from navigation history."""
+
+    def test_short_history_uses_direction(self, prefetch_service):
+        """Test that one move is not enough to override the direction."""
+        indices = prefetch_service._calculate_prefetch_indices(11, 100, "forward", [10, 11])
+
+        assert indices == [12, 13, 14]
+
+    def test_constant_stride_is_followed(self, prefetch_service):
+        """Test that a steady stride predicts the next slices."""
+        indices = prefetch_service._calculate_prefetch_indices(14, 100, "forward", [10, 12, 14])
+
+        assert indices == [16, 18, 20]
+
+    def test_backward_stride_overrides_direction(self, prefetch_service):
+        """Test that history showing backward moves wins over the parameter."""
+        indices = prefetch_service._calculate_prefetch_indices(7, 100, "forward", [9, 8, 7])
+
+        assert indices == [6, 5, 4]
+
+    def test_uneven_moves_fall_back_to_unit_stride(self, prefetch_service):
+        """Test that same-direction moves of varying size use a stride of 1."""
+        indices = prefetch_service._calculate_prefetch_indices(17, 100, "backward", [10, 11, 13, 17])
+
+        assert indices == [18, 19, 20]
+
+    def test_erratic_navigation_skips_prefetch(self, prefetch_service):
+        """Test that back-and-forth navigation prefetches nothing."""
+        indices = prefetch_service._calculate_prefetch_indices(11, 100, "forward", [10, 11, 10, 11])
+
+        assert indices == []
+
+    def test_repeated_slice_is_not_a_move(self, prefetch_service):
+        """Test that re-requesting a slice doesn't break the pattern."""
+        indices = prefetch_service._calculate_prefetch_indices(12, 100, "forward", [10, 11, 11, 12])
+
+        assert indices == [13, 14, 15]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_records_history(self, source, prefetch_service, mock_imaging_service):
+        """Test that prefetch_slices learns the stride across calls."""
+        for current in (10, 12, 14):
+            await prefetch_service.prefetch_slices("test_file", source, current, 100)
+
+        requested = [call.kwargs["slice_index"] for call in mock_imaging_service.get_slice_from_source.call_args_list]
+        assert requested[-3:] == [16, 18, 20]
+
+
+class TestPollutionFeedback:
+    """Test suite for adapting the prefetch window to cache pollution."""
+
+    def test_miss_on_prefetched_slice_halves_window(self, prefetch_service):
+        """Test that an evicted prefetch shrinks the window (never below 1)."""
+        prefetch_module._sessions.record_prefetched("test_file", [11, 12, 13, 14, 15])
+        session = prefetch_module._sessions.get("test_file")
+
+        prefetch_service.report_access("test_file", 11, was_hit=False)
+        assert session.window == 5
+
+        for idx in (12, 13, 14, 15):
+            prefetch_service.report_access("test_file", idx, was_hit=False)
+        assert session.window == 1
+        assert prefetch_service.effective_prefetch_count("test_file") == 1
+        assert prefetch_service._calculate_prefetch_indices(10, 100, "forward", window=session.window) == [11]
+
+    def test_hit_on_prefetched_slice_grows_window(self, prefetch_service):
+        """Test that used prefetches grow the window back one slice at a time."""
+        session = prefetch_module._sessions.get("test_file")
+        session.window = 1
+        prefetch_module._sessions.record_prefetched("test_file", [11, 12])
+
+        prefetch_service.report_access("test_file", 11, was_hit=True)
+        prefetch_service.report_access("test_file", 12, was_hit=True)
+
+        assert session.window == 3
+
+    def test_slices_not_prefetched_are_ignored(self, prefetch_service):
+        """Test that ordinary misses don't count as pollution."""
+        prefetch_service.report_access("test_file", 42, was_hit=False)
+
+        assert prefetch_service.effective_prefetch_count("test_file") == prefetch_service.prefetch_count
+        assert prefetch_module._sessions.pollution_events == 0
+
+    def test_pollution_is_tracked_per_file(self, prefetch_service):
+        """Test that one file's evicted prefetches don't shrink another file's window."""
+        prefetch_module._sessions.record_prefetched("busy_file", [11, 12])
+        prefetch_service.report_access("busy_file", 11, was_hit=False)
+        prefetch_service.report_access("busy_file", 12, was_hit=False)
+
+        assert prefetch_module._sessions.get("busy_file").window == 2
+        assert prefetch_module._sessions.get("other_file").window == prefetch_module._PrefetchSessions.MAX_WINDOW
+
+    @pytest.mark.asyncio
+    async def test_prefetch_does_not_probe_current_slice(self, source, prefetch_service, mock_cache_service):
+        """Test that the viewed slice is left out of the probe: the route reports it."""
+        await prefetch_service.prefetch_slices("test_file", source, 10, 100)
+
+        # By now the route has re-cached slice 11, so a probe would always hit
+        mock_cache_service.exists_many.reset_mock()
+        await prefetch_service.prefetch_slices("test_file", source, 11, 100)
+
+        keys = mock_cache_service.exists_many.await_args.args[0]
+        assert source.cache_key(11) not in keys
+        assert prefetch_module._sessions.pollution_events == 0
+
+
 class TestCacheFiltering:
     """Test suite for cache filtering logic."""
 
     @pytest.mark.asyncio
-    async def test_filter_all_uncached(self, prefetch_service, mock_cache_service):
+    async def test_filter_all_uncached(self, source, prefetch_service, mock_cache_service):
         """Test filtering when all slices are uncached."""
         mock_cache_service.exists.return_value = False
 
         uncached = await prefetch_service._filter_uncached_slices(
             file_id="test_file",
+            source=source,
             indices=[1, 2, 3, 4, 5]
         )
 
-        # All slices should be uncached
+        # All slices should be uncached, checked in one batched call
         assert uncached == [1, 2, 3, 4, 5]
-        assert mock_cache_service.exists.call_count == 5
+        mock_cache_service.exists_many.assert_awaited_once_with(
+            [source.cache_key(i) for i in range(1, 6)]
+        )
 
     @pytest.mark.asyncio
-    async def test_filter_all_cached(self, prefetch_service, mock_cache_service):
+    async def test_filter_all_cached(self, source, prefetch_service, mock_cache_service):
         """Test filtering when all slices are cached."""
         mock_cache_service.exists.return_value = True
 
         uncached = await prefetch_service._filter_uncached_slices(
             file_id="test_file",
+            source=source,
             indices=[1, 2, 3, 4, 5]
         )
 
         # No slices should be uncached
         assert uncached == []
-        assert mock_cache_service.exists.call_count == 5
+        assert mock_cache_service.exists_many.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_filter_partially_cached(self, prefetch_service, mock_cache_service):
+    async def test_filter_partially_cached(self, source, prefetch_service, mock_cache_service):
         """Test filtering when some slices are cached."""
         # Simulate slices 2 and 4 being cached
         call_count = [0]
 
         async def exists_mock(key: str):
             call_count[0] += 1
-            # Cache keys: slice:test_file:1, slice:test_file:2, etc.
-            return ":2" in key or ":4" in key
+            return key in (source.cache_key(2), source.cache_key(4))
 
         mock_cache_service.exists = exists_mock
 
         uncached = await prefetch_service._filter_uncached_slices(
             file_id="test_file",
+            source=source,
             indices=[1, 2, 3, 4, 5]
         )
 
@@ -155,7 +288,7 @@ class TestPrefetching:
     """Test suite for actual prefetching operations."""
 
     @pytest.mark.asyncio
-    async def test_prefetch_disabled(self, mock_imaging_service, mock_cache_service):
+    async def test_prefetch_disabled(self, source, mock_imaging_service, mock_cache_service):
         """Test that prefetching returns 0 when disabled."""
         service = PrefetchService(
             imaging_service=mock_imaging_service,
@@ -167,6 +300,7 @@ class TestPrefetching:
 
         count = await service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=10,
             total_slices=100,
             direction="forward"
@@ -175,16 +309,17 @@ class TestPrefetching:
         assert count == 0
 
     @pytest.mark.asyncio
-    async def test_prefetch_success(self, prefetch_service, mock_cache_service, mock_imaging_service):
+    async def test_prefetch_success(self, source, prefetch_service, mock_cache_service, mock_imaging_service):
         """Test successful prefetching operation."""
         # All slices uncached
         mock_cache_service.exists.return_value = False
 
         # Mock successful slice retrieval
-        mock_imaging_service.get_slice.return_value = {"data": "slice_data"}
+        mock_imaging_service.get_slice_from_source.return_value = ({"data": "slice_data"}, False)
 
         count = await prefetch_service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=10,
             total_slices=100,
             direction="forward"
@@ -192,16 +327,17 @@ class TestPrefetching:
 
         # Should prefetch 3 slices successfully
         assert count == 3
-        assert mock_imaging_service.get_slice.call_count == 3
+        assert mock_imaging_service.get_slice_from_source.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_prefetch_no_uncached_slices(self, prefetch_service, mock_cache_service, mock_imaging_service):
+    async def test_prefetch_no_uncached_slices(self, source, prefetch_service, mock_cache_service, mock_imaging_service):
         """Test prefetching when all slices are already cached."""
         # All slices cached
         mock_cache_service.exists.return_value = True
 
         count = await prefetch_service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=10,
             total_slices=100,
             direction="forward"
@@ -209,15 +345,16 @@ class TestPrefetching:
 
         # No prefetching should occur
         assert count == 0
-        assert mock_imaging_service.get_slice.call_count == 0
+        assert mock_imaging_service.get_slice_from_source.call_count == 0
 
     @pytest.mark.asyncio
-    async def test_prefetch_at_boundary(self, prefetch_service, mock_cache_service, mock_imaging_service):
+    async def test_prefetch_at_boundary(self, source, prefetch_service, mock_cache_service, mock_imaging_service):
         """Test prefetching at boundary (no slices to prefetch)."""
         mock_cache_service.exists.return_value = False
 
         count = await prefetch_service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=99,
             total_slices=100,
             direction="forward"
@@ -225,59 +362,222 @@ class TestPrefetching:
 
         # No slices to prefetch at boundary
         assert count == 0
-        assert mock_imaging_service.get_slice.call_count == 0
+        assert mock_imaging_service.get_slice_from_source.call_count == 0
+
 
+class TestConcurrency:
+    """Test suite for priority-bounded concurrent execution."""
+
+    @staticmethod
+    def _tracking_tasks(count: int, running: list, peak: list):
+        """Build task factories that record how many run at once."""
+        async def task():
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0)
+            running[0] -= 1
+            return True
 
-class TestRateLimiting:
-    """Test suite for rate limiting functionality."""
+        return [task for _ in range(count)]
 
     @pytest.mark.asyncio
-    async def test_rate_limiting_applies_delays(self, prefetch_service):
-        """Test that rate limiting applies appropriate delays."""
-        # Create dummy async coroutines that return True
-        async def dummy_task():
+    async def test_tasks_overlap_up_to_priority_limit(self, prefetch_service):
+        """Test that tasks run concurrently, capped by the priority limit."""
+        running, peak = [0], [0]
+        tasks = self._tracking_tasks(10, running, peak)
+
+        results = await prefetch_service._execute_with_concurrency(tasks)
+
+        # All tasks complete, in order
+        assert results == [True] * 10
+
+        # Normal priority overlaps tasks but stays within its limit
+        limit = prefetch_service._priority_concurrency["normal"]
+        assert peak[0] == limit
+
+    @pytest.mark.asyncio
+    async def test_low_priority_runs_one_at_a_time(self, mock_imaging_service, mock_cache_service):
+        """Test that low priority never overlaps tasks."""
+        service = PrefetchService(
+            imaging_service=mock_imaging_service,
+            cache_service=mock_cache_service,
+            priority="low"
+        )
+        running, peak = [0], [0]
+
+        await service._execute_with_concurrency(self._tracking_tasks(5, running, peak))
+
+        assert peak[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_returned(self, prefetch_service):
+        """Test that a failing task does not cancel the others."""
+        async def ok():
             return True
 
-        tasks = [dummy_task() for _ in range(3)]
+        async def fail():
+            raise RuntimeError("boom")
+
+        results = await prefetch_service._execute_with_concurrency([ok, fail, ok])
 
-        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            results = await prefetch_service._execute_with_rate_limit(tasks)
+        assert results[0] is True and results[2] is True
+        assert isinstance(results[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_single_task_skips_gather(self, prefetch_service):
+        """Test that a lone task runs directly, still returning its exception."""
+        async def fail():
+            raise RuntimeError("boom")
 
-            # Should have called sleep between tasks (not after last)
-            # Priority "normal" = 0.2s = 200ms
-            assert mock_sleep.call_count == 2  # Between 3 tasks
+        with patch("app.services.prefetch_service.asyncio.gather") as gather:
+            results = await prefetch_service._execute_with_concurrency([fail])
 
-            # All tasks should complete
-            assert len(results) == 3
-            assert all(r is True for r in results)
+        gather.assert_not_called()
+        assert len(results) == 1 and isinstance(results[0], RuntimeError)
+        assert await prefetch_service._execute_with_concurrency([]) == []
 
     @pytest.mark.asyncio
-    async def test_rate_limiting_correct_delay(self, prefetch_service):
-        """Test that rate limiting uses correct delay for priority."""
-        async def dummy_task():
+    async def test_stream_yields_in_completion_order(self, prefetch_service):
+        """Test that streamed results arrive as tasks finish, tagged with their position."""
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        stream = prefetch_service._stream_with_concurrency([slow, fast])
+        first = await stream.__anext__()
+        release.set()
+        rest = [item async for item in stream]
+
+        assert first == (1, "fast")
+        assert rest == [(0, "slow")]
+
+    @pytest.mark.asyncio
+    async def test_stream_cancels_unfinished_tasks_on_close(self, prefetch_service):
+        """Test that closing the stream early cancels tasks still running."""
+        cancelled = []
+
+        async def hanging():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def fast():
             return True
 
-        tasks = [dummy_task() for _ in range(2)]
+        stream = prefetch_service._stream_with_concurrency([hanging, fast])
+        assert await stream.__anext__() == (1, True)
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert cancelled == [True]
+
+
+class TestBackgroundScheduling:
+    """Test suite for fire-and-forget prefetch scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_returns_task(self, source, prefetch_service, mock_imaging_service):
+        """Test that scheduling returns immediately with a running task."""
+        task = prefetch_service.schedule_prefetch_slices(
+            file_id="test_file",
+            source=source,
+            current_slice=10,
+            total_slices=100,
+            direction="forward"
+        )
+
+        assert isinstance(task, asyncio.Task)
+        assert await task == 3
+        assert mock_imaging_service.get_slice_from_source.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_schedule_disabled(self, source, prefetch_service):
+        """Test that nothing is scheduled when prefetching is disabled."""
+        prefetch_service.enabled = False
+
+        assert prefetch_service.schedule_prefetch_slices("test_file", source, 10, 100) is None
+
+    @pytest.mark.asyncio
+    async def test_direction_change_cancels_stale_prefetch(self, source, prefetch_service, mock_imaging_service):
+        """Test that flipping direction cancels prefetches for the old one."""
+        release = asyncio.Event()
+
+        async def slow_slice(**kwargs):
+            await release.wait()
+            return {"data": "slice_data"}, False
+
+        mock_imaging_service.get_slice_from_source.side_effect = slow_slice
+
+        forward = prefetch_service.schedule_prefetch_slices("test_file", source, 10, 100, "forward")
+        await asyncio.sleep(0)
+        backward = prefetch_service.schedule_prefetch_slices("test_file", source, 9, 100, "backward")
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await forward
+        assert await backward == 3
+
+
+class TestSingleFlight:
+    """Test suite for deduplicating concurrent loads of the same slice."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_prefetches_share_one_load(self, source, prefetch_service, mock_imaging_service):
+        """Test that a slice already being loaded is awaited, not reloaded."""
+        release = asyncio.Event()
+
+        async def slow_slice(**kwargs):
+            await release.wait()
+            return {"data": "slice_data"}, False
+
+        mock_imaging_service.get_slice_from_source.side_effect = slow_slice
+
+        first = asyncio.create_task(prefetch_service._prefetch_single_slice(source, 5))
+        second = asyncio.create_task(prefetch_service._prefetch_single_slice(source, 5))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == [True, True]
+        assert mock_imaging_service.get_slice_from_source.call_count == 1
+        assert prefetch_module._inflight_slices == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_releases_waiters(self, source, prefetch_service, mock_imaging_service):
+        """Test that cancelling the loading prefetch resolves its waiters as not prefetched."""
+        async def hanging_slice(**kwargs):
+            await asyncio.Event().wait()
+
+        mock_imaging_service.get_slice_from_source.side_effect = hanging_slice
 
-        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            await prefetch_service._execute_with_rate_limit(tasks)
+        first = asyncio.create_task(prefetch_service._prefetch_single_slice(source, 5))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(prefetch_service._prefetch_single_slice(source, 5))
+        await asyncio.sleep(0)
+        first.cancel()
 
-            # Normal priority = 0.2s delay
-            if mock_sleep.call_count > 0:
-                mock_sleep.assert_called_with(0.2)
+        assert await second is False
+        assert prefetch_module._inflight_slices == {}
 
 
 class TestPrefetchRange:
     """Test suite for range prefetching."""
 
     @pytest.mark.asyncio
-    async def test_prefetch_range_success(self, prefetch_service, mock_cache_service, mock_imaging_service):
+    async def test_prefetch_range_success(self, source, prefetch_service, mock_cache_service, mock_imaging_service):
         """Test successful range prefetching."""
         mock_cache_service.exists.return_value = False
-        mock_imaging_service.get_slice.return_value = {"data": "slice_data"}
+        mock_imaging_service.get_slice_from_source.return_value = ({"data": "slice_data"}, False)
 
         result = await prefetch_service.prefetch_range(
             file_id="test_file",
+            source=source,
             start_slice=10,
             end_slice=15
         )
@@ -287,7 +587,7 @@ class TestPrefetchRange:
         assert result["failed"] == 0
 
     @pytest.mark.asyncio
-    async def test_prefetch_range_disabled(self, mock_imaging_service, mock_cache_service):
+    async def test_prefetch_range_disabled(self, source, mock_imaging_service, mock_cache_service):
         """Test range prefetching when service is disabled."""
         service = PrefetchService(
             imaging_service=mock_imaging_service,
@@ -297,6 +597,7 @@ class TestPrefetchRange:
 
         result = await service.prefetch_range(
             file_id="test_file",
+            source=source,
             start_slice=10,
             end_slice=15
         )
@@ -338,19 +639,64 @@ class TestMetadataPrefetching:
         mock_imaging_service.get_file_metadata.assert_not_called()
 
 
+class TestStudyPrefetching:
+    """Test suite for combined metadata + slice prefetching."""
+
+    @pytest.mark.asyncio
+    async def test_probe_study_single_round_trip(self, source, prefetch_service, mock_cache_service):
+        """Test that metadata and slices are probed in one batched call."""
+        async def exists_many(keys):
+            return [key in ("metadata:test_file", source.cache_key(1)) for key in keys]
+
+        mock_cache_service.exists_many.side_effect = exists_many
+
+        metadata_cached, uncached = await prefetch_service.probe_study("test_file", source, [0, 1, 2])
+
+        assert metadata_cached is True
+        assert uncached == [0, 2]
+        mock_cache_service.exists_many.assert_awaited_once_with(
+            ["metadata:test_file", source.cache_key(0), source.cache_key(1), source.cache_key(2)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetch_study_loads_missing_metadata_and_slices(
+        self, source, prefetch_service, mock_cache_service, mock_imaging_service
+    ):
+        """Test that missing metadata and slices are both loaded."""
+        result = await prefetch_service.prefetch_study("test_file", source, [0, 1, 2])
+
+        assert result == {"metadata": 1, "success": 3, "failed": 0}
+        mock_imaging_service.get_file_metadata.assert_awaited_once_with("test_file")
+        assert mock_cache_service.exists_many.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_study_skips_cached_metadata(
+        self, source, prefetch_service, mock_cache_service, mock_imaging_service
+    ):
+        """Test that cached metadata is not fetched again."""
+        mock_cache_service.exists.return_value = True
+
+        result = await prefetch_service.prefetch_study("test_file", source, [0, 1])
+
+        assert result == {"metadata": 1, "success": 0, "failed": 0}
+        mock_imaging_service.get_file_metadata.assert_not_called()
+        mock_imaging_service.get_slice_from_source.assert_not_called()
+
+
 class TestEdgeCases:
     """Test suite for edge cases and error handling."""
 
     @pytest.mark.asyncio
-    async def test_prefetch_with_errors(self, prefetch_service, mock_cache_service, mock_imaging_service):
+    async def test_prefetch_with_errors(self, source, prefetch_service, mock_cache_service, mock_imaging_service):
         """Test prefetching handles errors gracefully."""
         mock_cache_service.exists.return_value = False
 
-        # Simulate errors in get_slice
-        mock_imaging_service.get_slice.side_effect = Exception("Test error")
+        # Simulate errors in get_slice_from_source
+        mock_imaging_service.get_slice_from_source.side_effect = Exception("Test error")
 
         count = await prefetch_service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=10,
             total_slices=100,
             direction="forward"
@@ -360,12 +706,13 @@ class TestEdgeCases:
         assert count == 0
 
     @pytest.mark.asyncio
-    async def test_prefetch_empty_file_id(self, prefetch_service, mock_cache_service):
+    async def test_prefetch_empty_file_id(self, source, prefetch_service, mock_cache_service):
         """Test prefetching with empty file_id."""
         mock_cache_service.exists.return_value = False
 
         count = await prefetch_service.prefetch_slices(
             file_id="",
+            source=source,
             current_slice=10,
             total_slices=100,
             direction="forward"
@@ -376,10 +723,11 @@ class TestEdgeCases:
         assert count >= 0
 
     @pytest.mark.asyncio
-    async def test_prefetch_zero_total_slices(self, prefetch_service):
+    async def test_prefetch_zero_total_slices(self, source, prefetch_service):
         """Test prefetching with zero total slices."""
         count = await prefetch_service.prefetch_slices(
             file_id="test_file",
+            source=source,
             current_slice=0,
             total_slices=0,
             direction="forward"
@@ -395,8 +743,86 @@ class TestEdgeCases:
         assert "enabled" in stats
         assert "prefetch_count" in stats
         assert "priority" in stats
-        assert "priority_delay_ms" in stats
+        assert "max_concurrency" in stats
+        assert stats["tracked_files"] == 0
 
         assert stats["prefetch_count"] == 3
         assert stats["priority"] == "normal"
-        assert stats["priority_delay_ms"] == 200  # 0.2s * 1000
+        assert stats["max_concurrency"] == prefetch_service._priority_concurrency["normal"]
+
+
+class TestImagingRoundTrip:
+    """Test prefetching against a real ImagingService and an in-memory cache."""
+
+    class _DictCache:
+        """Just the cache calls ImagingService and PrefetchService make."""
+
+        def __init__(self):
+            self.store = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, value, ttl=None):
+            self.store[key] = value
+            return True
+
+        async def exists_many(self, keys):
+            return [key in self.store for key in keys]
+
+    @pytest.fixture
+    def scan(self, tmp_path):
+        """A small NIfTI volume, a real ImagingService and a prefetcher sharing one cache."""
+        import nibabel as nib
+        import numpy as np
+        from app.services.imaging_service import ImagingService
+
+        path = tmp_path / "scan.nii"
+        nib.Nifti1Image(np.random.randint(0, 1000, size=(16, 16, 20)).astype(np.int16), np.eye(4)).to_filename(str(path))
+
+        cache = self._DictCache()
+        imaging_service = ImagingService(cache_service=cache)
+        service = PrefetchService(imaging_service=imaging_service, cache_service=cache, prefetch_count=3)
+        return path.read_bytes(), cache, imaging_service, service
+
+    @staticmethod
+    async def _view(imaging_service, service, file_data, slice_index):
+        """Serve a slice in the order the slice route does: render, report, prefetch."""
+        source = imaging_service.slice_source(file_data, "scan.nii", 40.0, 400.0)
+        slice_result, cache_hit = await imaging_service.get_slice_from_source(source, slice_index)
+        service.report_access("scan", slice_index, cache_hit)
+        await service.prefetch_slices("scan", source, slice_index, 20)
+        return source, slice_result
+
+    @pytest.mark.asyncio
+    async def test_prefetched_slice_is_read_by_slice_route(self, scan):
+        """Test that a prefetched slice lands under the key the slice route reads."""
+        file_data, cache, imaging_service, service = scan
+
+        # Viewer opens slice 10; slices 11-13 are prefetched
+        source, _ = await self._view(imaging_service, service, file_data, 10)
+        assert source.cache_key(11) in cache.store
+
+        # Viewing the prefetched slice counts as a hit (window grows), not as pollution
+        session = prefetch_module._sessions.get("scan")
+        session.window = 5
+        _, slice_result = await self._view(imaging_service, service, file_data, 11)
+
+        assert slice_result.slice_index == 11
+        assert prefetch_module._sessions.pollution_events == 0
+        assert session.window == 6
+
+    @pytest.mark.asyncio
+    async def test_evicted_prefetch_is_reported_as_pollution(self, scan):
+        """Test that viewing an evicted prefetched slice halves the window."""
+        file_data, cache, imaging_service, service = scan
+        source, _ = await self._view(imaging_service, service, file_data, 10)
+
+        # Evicted before the viewer gets there; serving it re-caches it
+        del cache.store[source.cache_key(11)]
+        session = prefetch_module._sessions.get("scan")
+        session.window = 8
+        await self._view(imaging_service, service, file_data, 11)
+
+        assert prefetch_module._sessions.pollution_events == 1
+        assert session.window == 4
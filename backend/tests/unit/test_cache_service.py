@@ -102,6 +102,24 @@ class TestCacheService:
         assert result is True
         mock_redis.exists.assert_called_once_with(key)
 
+    @pytest.mark.asyncio
+    async def test_exists_many(self, cache_service, mock_redis):
+        """Test checking several keys in one pipelined round trip."""
+        # Arrange
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(return_value=[1, 0, 1])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        # Act
+        result = await cache_service.exists_many(["a", "b", "c"])
+
+        # Assert
+        assert result == [True, False, True]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.exists.call_count == 3
+        pipe.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_clear_pattern(self, cache_service, mock_redis):
         """Test clearing keys by pattern."""
@@ -191,6 +209,28 @@ class TestCacheService:
         assert result is True
         assert mock_redis.set.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_set_with_expiry(self, cache_service, mock_redis):
+        """Test that set_many sends one SET EX per key in a single round trip."""
+        # Arrange
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(return_value=[True, None])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        # Act
+        result = await cache_service.set_many(
+            {"key1": "value1", "key2": "value2"}, ttl=timedelta(seconds=60), nx=True
+        )
+
+        # Assert
+        assert result is True
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        pipe.set.assert_any_call("key1", b'"value1"', ex=60, nx=True)
+        pipe.expire.assert_not_called()
+        pipe.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_many(self, cache_service, mock_redis):
         """Test getting multiple keys."""
@@ -0,0 +1,46 @@
+"""
+Unit tests for shared image utilities.
+"""
+
+import base64
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from app.utils.image_utils import array_to_base64, compute_min_max, normalize_to_uint8
+
+
+@pytest.mark.unit
+class TestNumpyFallbacks:
+    """The NumPy paths used when optional accelerators are not installed."""
+
+    def test_normalize_without_numba_matches_kernel(self):
+        """Test that normalize_to_uint8 gives the same pixels with and without Numba."""
+        # Arrange
+        volume = np.random.randint(-1000, 3000, size=(6, 32, 32)).astype(np.int16)
+        expected = normalize_to_uint8(volume)
+
+        # Act
+        with patch("app.utils.image_utils._min_max_kernel", None), \
+             patch("app.utils.image_utils._scale_to_uint8_kernel", None):
+            value_range = compute_min_max(volume)
+            result = normalize_to_uint8(volume)
+
+        # Assert
+        assert value_range == (volume.min(), volume.max())
+        np.testing.assert_array_equal(result, expected)
+
+    def test_array_to_base64_with_stdlib_codec(self):
+        """Test that PNG encoding gives the same string with the stdlib base64 codec."""
+        # Arrange
+        array = np.random.randint(0, 256, size=(16, 16), dtype=np.uint8)
+        expected = array_to_base64(array)
+
+        # Act
+        with patch("app.utils.image_utils.base64", base64):
+            result = array_to_base64(array)
+
+        # Assert
+        assert result == expected
+        assert result.startswith("data:image/png;base64,")
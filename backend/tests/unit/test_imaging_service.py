@@ -2,11 +2,14 @@
 Unit tests for ImagingService.
 """
 
+import threading
+
 import pytest
 import numpy as np
 from unittest.mock import AsyncMock, MagicMock, patch, mock_open
-from app.services.imaging_service import ImagingService
+from app.services.imaging_service import ImagingService, _block_mean, _contig_slice, _figure_to_png, _segmentation_overlay
 from app.core.exceptions import ImageProcessingException
+from app.models.schemas import ImageFormat, ImageMetadata
 
 
 @pytest.mark.unit
@@ -43,7 +46,20 @@ class TestImagingService:
 
         # Assert
         assert hash1 == hash2  # Same data should produce same hash
-        assert len(hash1) == 32  # MD5 hash is 32 characters
+        assert len(hash1) == 32  # 128-bit hex digest
+
+    def test_generate_file_hash_without_xxhash(self, imaging_service):
+        """Test that the hash falls back to MD5 when xxhash is unavailable."""
+        # Arrange
+        import hashlib
+        file_data = b"test data"
+
+        # Act
+        with patch("app.services.imaging_service.xxhash", None):
+            result = imaging_service._generate_file_hash(file_data)
+
+        # Assert
+        assert result == hashlib.md5(file_data).hexdigest()
 
     def test_file_hash_uniqueness(self, imaging_service):
         """Test that different data produces different hashes."""
@@ -58,6 +74,358 @@ class TestImagingService:
         # Assert
         assert hash1 != hash2
 
+    def test_load_array_reuses_decoded_array(self, imaging_service):
+        """Test that a second load of the same bytes skips decoding."""
+        # Arrange
+        file_data = b"decoded array cache test"
+        volume = np.zeros((4, 4, 2), dtype=np.uint8)
+        metadata = ImageMetadata(rows=4, columns=4, slices=2)
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.NIFTI), \
+             patch.object(imaging_service, "load_nifti", return_value=(volume, metadata)) as load_nifti:
+            # Act
+            first, _, _ = imaging_service._load_array(file_data, "test.nii")
+            second, second_metadata, img_format = imaging_service._load_array(file_data, "test.nii")
+
+        # Assert
+        load_nifti.assert_called_once()
+        assert second is first
+        assert not second.flags.writeable
+        assert img_format == ImageFormat.NIFTI
+        assert second_metadata is not metadata
+
+    def test_load_array_returns_slice_first_layout(self, imaging_service):
+        """Test that decoded volumes are re-laid out so each slice is contiguous."""
+        # Arrange
+        file_data = b"slice-first layout test"
+        volume = np.arange(4 * 3 * 2, dtype=np.uint8).reshape(4, 3, 2)
+        metadata = ImageMetadata(rows=4, columns=3, slices=2)
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.NIFTI), \
+             patch.object(imaging_service, "load_nifti", return_value=(volume, metadata)):
+            # Act
+            pixel_array, loaded_metadata, _ = imaging_service._load_array(file_data, "test.nii")
+
+        # Assert
+        assert pixel_array.shape == (2, 4, 3)
+        assert pixel_array[1].flags.c_contiguous
+        np.testing.assert_array_equal(pixel_array[1], volume[:, :, 1])
+        assert loaded_metadata.slices == 2
+
+    def test_contig_slice_views_c_order_and_copies_otherwise(self):
+        """Test that slices are views of C-ordered volumes and contiguous copies of others."""
+        # Arrange
+        volume = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+        fortran_volume = np.asfortranarray(volume)
+
+        # Act
+        view = _contig_slice(volume, 1)
+        copy = _contig_slice(fortran_volume, 1)
+
+        # Assert
+        assert np.shares_memory(view, volume)
+        assert copy.flags.c_contiguous
+        np.testing.assert_array_equal(copy, volume[1])
+
+    def test_block_mean_pools_and_repeats(self):
+        """Test block-mean downsampling, including axes shorter than the target."""
+        # Arrange
+        volume = np.random.randint(0, 255, size=(40, 60, 5)).astype(np.uint8)
+
+        # Act
+        pooled = _block_mean(volume, (20, 20, 10))
+
+        # Assert
+        expected = volume.reshape(20, 2, 20, 3, 5).mean(axis=(1, 3))
+        assert pooled.shape == (20, 20, 10)
+        np.testing.assert_allclose(pooled, np.repeat(expected, 2, axis=2))
+
+    def test_compute_min_max_matches_numpy(self):
+        """Test single-pass extrema against NumPy for integer and float arrays."""
+        # Arrange
+        from app.utils import compute_min_max
+
+        ints = np.random.randint(-1000, 3000, size=(16, 16, 4)).astype(np.int16)
+        floats = np.random.rand(8, 8)
+        floats[3, 3] = np.nan
+
+        # Act
+        int_range = compute_min_max(ints)
+        float_range = compute_min_max(floats)
+
+        # Assert
+        assert int_range == (ints.min(), ints.max())
+        assert type(int_range[0]) is np.int16
+        assert np.isnan(float_range[0]) and np.isnan(float_range[1])
+
+    @pytest.mark.asyncio
+    async def test_get_slice_2d_inside_running_loop(self, imaging_service, mock_cache):
+        """Test that the sync slice API works while an event loop is running."""
+        # Arrange
+        volume = np.random.randint(0, 255, size=(8, 6, 3), dtype=np.uint8)
+        metadata = ImageMetadata(rows=8, columns=6, slices=3)
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.DICOM), \
+             patch.object(imaging_service, "load_dicom", return_value=(volume, metadata)):
+            # Act
+            result = imaging_service.get_slice_2d(b"sync slice test", "test.dcm", 1)
+
+        # Assert
+        assert result.slice_index == 1
+        assert (result.width, result.height) == (6, 8)
+        mock_cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_slice_with_window_renders_off_event_loop(self, imaging_service, mock_cache):
+        """Test that a cache miss renders the slice in a worker thread."""
+        # Arrange
+        volume = np.random.randint(0, 255, size=(8, 6, 3), dtype=np.uint8)
+        metadata = ImageMetadata(rows=8, columns=6, slices=3)
+        render_threads = []
+        render = imaging_service._render_slice
+
+        def tracking_render(*args, **kwargs):
+            render_threads.append(threading.get_ident())
+            return render(*args, **kwargs)
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.DICOM), \
+             patch.object(imaging_service, "load_dicom", return_value=(volume, metadata)), \
+             patch.object(imaging_service, "_render_slice", side_effect=tracking_render):
+            # Act
+            result = await imaging_service.get_slice_with_window(b"threaded slice", "test.dcm", 2)
+
+        # Assert
+        assert result.slice_index == 2
+        assert render_threads and render_threads[0] != threading.get_ident()
+        mock_cache.set.assert_awaited_once()
+
+    def test_normalize_to_uint8_wide_integer_range(self):
+        """Test that normalizing int16 data spanning most of its range does not overflow."""
+        # Arrange
+        from app.utils import normalize_to_uint8
+
+        data = np.array([-30000, 0, 30000], dtype=np.int16)
+
+        # Act
+        result = normalize_to_uint8(data)
+
+        # Assert
+        np.testing.assert_array_equal(result, np.array([0, 127, 255], dtype=np.uint8))
+
+    def test_series_cache_roundtrip(self, imaging_service):
+        """Test that a packed series response unpacks to an equal response."""
+        # Arrange
+        from app.models.schemas import ImageSeriesResponse, ImageSlice
+
+        response = ImageSeriesResponse(
+            id="scan.nii",
+            name="scan.nii",
+            format=ImageFormat.NIFTI,
+            metadata=ImageMetadata(rows=2, columns=2, slices=1),
+            total_slices=1,
+            slices=[ImageSlice(slice_index=0, image_data="iVBORw0KGgo=", format=ImageFormat.NIFTI, width=2, height=2)]
+        )
+
+        # Act
+        restored = imaging_service._unpack_series(imaging_service._pack_series(response))
+
+        # Assert
+        assert restored == response
+
+    def test_series_cache_without_zstandard(self, imaging_service):
+        """Test the plain-dict series cache used when zstandard is unavailable."""
+        # Arrange
+        from app.models.schemas import ImageSeriesResponse
+
+        response = ImageSeriesResponse(
+            id="scan.nii",
+            name="scan.nii",
+            format=ImageFormat.NIFTI,
+            metadata=ImageMetadata(rows=2, columns=2, slices=0),
+            total_slices=0,
+            slices=[]
+        )
+        compressed = imaging_service._pack_series(response)
+
+        # Act
+        with patch("app.services.imaging_service.zstd", None):
+            packed = imaging_service._pack_series(response)
+            restored = imaging_service._unpack_series(packed)
+            undecodable = imaging_service._unpack_series(compressed)
+
+        # Assert
+        assert isinstance(packed, dict)
+        assert restored == response
+        assert undecodable is None  # Treated as a cache miss
+
+    def test_load_nifti_matches_float64_normalization(self, imaging_service, tmp_path):
+        """Test that reading voxels at their stored dtype normalizes like get_fdata."""
+        # Arrange
+        import nibabel as nib
+
+        volume = np.random.randint(-1000, 3000, size=(12, 10, 6)).astype(np.int16)
+        path = tmp_path / "volume.nii.gz"
+        nib.Nifti1Image(volume, np.eye(4)).to_filename(str(path))
+        reference = nib.load(str(path)).get_fdata()
+        expected = (
+            (reference - reference.min()) / (reference.max() - reference.min()) * 255.0
+        ).astype(np.uint8)
+
+        # Act
+        data, metadata = imaging_service.load_nifti(path.read_bytes())
+
+        # Assert
+        np.testing.assert_array_equal(data, expected)
+        assert metadata.slices == 6
+
+    def test_load_nifti_reads_nifti2(self, imaging_service, tmp_path):
+        """Test that NIfTI-2 files load through the in-memory reader."""
+        # Arrange
+        import nibabel as nib
+
+        volume = np.arange(4 * 3 * 2, dtype=np.int16).reshape(4, 3, 2)
+        path = tmp_path / "volume.nii"
+        nib.Nifti2Image(volume, np.eye(4)).to_filename(str(path))
+
+        # Act
+        data, metadata = imaging_service.load_nifti(path.read_bytes())
+
+        # Assert
+        assert data.shape == (4, 3, 2)
+        assert (data.min(), data.max()) == (0, 255)
+        assert metadata.slices == 2
+
+    def test_normalize_to_uint8_big_endian(self):
+        """Test that non-native byte order takes the NumPy path."""
+        from app.utils.image_utils import compute_min_max, normalize_to_uint8
+
+        native = np.arange(-300, 300, dtype=np.int16).reshape(20, 30)
+        swapped = native.astype('>i2')
+
+        assert compute_min_max(swapped) == (-300, 299)
+        np.testing.assert_array_equal(
+            normalize_to_uint8(swapped), normalize_to_uint8(native)
+        )
+        np.testing.assert_array_equal(
+            normalize_to_uint8(swapped.astype('>f4')), normalize_to_uint8(native)
+        )
+
+    def test_detect_format_sniffs_header_magic(self, imaging_service, tmp_path):
+        """Test content-based format detection when the filename has no suffix."""
+        # Arrange
+        import nibabel as nib
+
+        path = tmp_path / "volume.nii.gz"
+        nib.Nifti1Image(np.zeros((4, 4, 2), dtype=np.int16), np.eye(4)).to_filename(str(path))
+        dicom_data = b"\x00" * 128 + b"DICM" + b"\x02\x00"
+
+        # Act / Assert
+        assert imaging_service.detect_format(path.read_bytes(), "upload") == ImageFormat.NIFTI
+        assert imaging_service.detect_format(dicom_data, "upload") == ImageFormat.DICOM
+
+    def test_segmentation_overlay_marks_labelled_voxels(self):
+        """Test that the overlay is opaque red on labels and transparent elsewhere."""
+        seg_slice = np.array([[0, 1], [3, 0]], dtype=np.uint8)
+
+        overlay = _segmentation_overlay(seg_slice)
+
+        assert overlay.shape == (2, 2, 4)
+        assert overlay.dtype == np.uint8
+        np.testing.assert_array_equal(overlay[0, 1], [255, 0, 0, 255])
+        np.testing.assert_array_equal(overlay[1, 0], [255, 0, 0, 255])
+        assert overlay[0, 0, 3] == 0 and overlay[1, 1, 3] == 0
+
+    def test_get_dicom_float_multi_valued_window(self):
+        """Test that multi-valued and empty DS elements parse without raising."""
+        from pydicom.dataset import Dataset
+        from app.utils.dicom_utils import get_dicom_float
+
+        ds = Dataset()
+        ds.WindowCenter = ['40', '400']
+        ds.WindowWidth = '350'
+        ds.SliceThickness = None
+
+        assert get_dicom_float(ds, 'WindowCenter') == 40.0
+        assert get_dicom_float(ds, 'WindowWidth') == 350.0
+        assert get_dicom_float(ds, 'SliceThickness', 1.0) == 1.0
+        assert get_dicom_float(ds, 'RescaleSlope') is None
+
+    @pytest.mark.asyncio
+    async def test_minimal_slice_overlays_segmentation(self, imaging_service):
+        """Test that the minimal render paints labelled voxels red."""
+        # Arrange
+        import base64
+        import io
+        from PIL import Image
+
+        volume = np.full((4, 4, 1), 100, dtype=np.uint8)
+        metadata = ImageMetadata(rows=4, columns=4, slices=1)
+        seg_slice = np.zeros((4, 4), dtype=np.uint8)
+        seg_slice[1, 2] = 1
+        segmentation_service = MagicMock()
+        segmentation_service.get_slice_mask = AsyncMock(return_value=seg_slice)
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.DICOM), \
+             patch.object(imaging_service, "load_dicom", return_value=(volume, metadata)), \
+             patch("app.core.container.get_segmentation_service", return_value=segmentation_service):
+            # Act
+            result = await imaging_service.generate_2d_matplotlib_slice(
+                b"overlay test", "test.dcm", 0,
+                window_center=127, window_width=254, minimal=True, segmentation_id="seg-1"
+            )
+
+        # Assert
+        png = base64.b64decode(result["image"].split(",", 1)[1])
+        rgb = np.asarray(Image.open(io.BytesIO(png)).convert("RGB"))
+        segmentation_service.get_slice_mask.assert_awaited_once_with("seg-1", 0)
+        assert rgb[1, 2, 0] > rgb[1, 2, 1]
+        assert rgb[0, 0, 0] == rgb[0, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_minimal_slice_renders_when_segmentation_fetch_fails(self, imaging_service):
+        """Test that a failing segmentation fetch still returns the plain slice."""
+        # Arrange
+        volume = np.full((4, 4, 1), 100, dtype=np.uint8)
+        metadata = ImageMetadata(rows=4, columns=4, slices=1)
+        segmentation_service = MagicMock()
+        segmentation_service.get_slice_mask = AsyncMock(side_effect=RuntimeError("storage down"))
+
+        with patch.object(imaging_service, "detect_format", return_value=ImageFormat.DICOM), \
+             patch.object(imaging_service, "load_dicom", return_value=(volume, metadata)), \
+             patch("app.core.container.get_segmentation_service", return_value=segmentation_service):
+            # Act
+            png_bytes, bbox = await imaging_service.render_2d_matplotlib_slice_png(
+                b"overlay failure test", "test.dcm", 0,
+                window_center=127, window_width=254, minimal=True, segmentation_id="seg-1"
+            )
+
+        # Assert
+        assert png_bytes.startswith(b"\x89PNG")
+        assert bbox is None
+
+    def test_load_slice_reads_large_nifti_lazily(self, imaging_service, tmp_path):
+        """Test that the lazy NIfTI slice path matches a full decode."""
+        # Arrange
+        import nibabel as nib
+        from app.utils import normalize_to_uint8
+
+        volume = np.random.randint(-1000, 3000, size=(12, 10, 6)).astype(np.int16)
+        path = tmp_path / "volume.nii.gz"
+        nib.Nifti1Image(volume, np.eye(4)).to_filename(str(path))
+        file_data = path.read_bytes()
+        expected = normalize_to_uint8(nib.load(str(path)).get_fdata())[:, :, 4]
+
+        with patch.object(imaging_service, "settings", MagicMock(IMAGING_ARRAY_CACHE_MAX_BYTES=0)), \
+             patch.object(imaging_service, "load_nifti") as load_nifti:
+            # Act
+            slice_data, metadata, img_format = imaging_service._load_slice(file_data, "volume.nii.gz", 4)
+
+        # Assert
+        load_nifti.assert_not_called()
+        np.testing.assert_array_equal(slice_data, expected)
+        assert metadata.slices == 6
+        assert img_format == ImageFormat.NIFTI
+
     def test_normalize_slice_to_uint8(self, imaging_service):
         """Test slice normalization to uint8."""
         # Arrange
@@ -115,6 +483,62 @@ class TestImagingService:
         assert result.dtype == np.uint8
         assert result.shape == slice_data.shape
 
+    def test_apply_window_level_matches_reference(self, imaging_service):
+        """Test public window/level against the clip-and-scale reference."""
+        # Arrange
+        slice_data = np.random.randint(0, 4000, size=(64, 64), dtype=np.uint16)
+        window_center = 40
+        window_width = 400
+        img_min = window_center - window_width // 2
+        img_max = window_center + window_width // 2
+        expected = (
+            (np.clip(slice_data, img_min, img_max) - img_min) / (img_max - img_min) * 255.0
+        ).astype(np.uint8)
+
+        # Act
+        result = imaging_service.apply_window_level(slice_data, window_center, window_width)
+
+        # Assert
+        assert result.dtype == np.uint8
+        assert result.shape == slice_data.shape
+        np.testing.assert_array_equal(result, expected)
+
+    def test_apply_window_level_numpy_fallback_matches_reference(self, imaging_service):
+        """Test the NumPy window/level path used when Numba is unavailable."""
+        # Arrange
+        slice_data = np.random.randint(0, 4000, size=(64, 64), dtype=np.uint16)
+        img_min, img_max = 40 - 400 // 2, 40 + 400 // 2
+        expected = (
+            (np.clip(slice_data, img_min, img_max) - img_min) / (img_max - img_min) * 255.0
+        ).astype(np.uint8)
+
+        # Act
+        with patch("app.services.imaging_service._window_level_kernel", None):
+            result = imaging_service.apply_window_level(slice_data, 40, 400)
+
+        # Assert
+        np.testing.assert_array_equal(result, expected)
+
+    def test_figure_to_png_without_fpng(self):
+        """Test that colored figures encode through Pillow when fpng is unavailable."""
+        # Arrange
+        import io
+        from matplotlib.figure import Figure
+        from PIL import Image
+
+        fig = Figure(figsize=(1, 1), dpi=32)
+        fig.add_subplot().imshow(np.random.rand(8, 8), cmap="viridis")
+
+        # Act
+        with patch("app.services.imaging_service.fpng", None):
+            png_bytes = _figure_to_png(fig, try_gray=True)
+
+        # Assert
+        image = Image.open(io.BytesIO(png_bytes))
+        assert image.format == "PNG"
+        assert image.mode == "RGBA"
+        assert image.size == (32, 32)
+
     def test_slice_to_base64(self, imaging_service):
         """Test conversion of slice to base64."""
         # Arrange
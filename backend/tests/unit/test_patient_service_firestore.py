@@ -0,0 +1,97 @@
+"""
+Unit tests for PatientServiceFirestore.
+"""
+
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.exceptions import ValidationException
+from app.models.patient_schemas import MedicalHistoryCreate
+from app.services import patient_service_firestore as patient_module
+from app.services.patient_service_firestore import MAX_BULK_HISTORY_ITEMS, PatientServiceFirestore
+
+
+@pytest.mark.unit
+class TestPatientPagination:
+    """Test suite for cursor pagination."""
+
+    @pytest.fixture
+    def patient_service(self):
+        """Create a patient service with a mocked Firestore client."""
+        with patch("app.services.patient_service_firestore.get_firestore_client", return_value=MagicMock()):
+            return PatientServiceFirestore()
+
+    @pytest.mark.parametrize("cursor", ["a/b", "not-a-uuid"])
+    def test_malformed_cursor_is_rejected(self, patient_service, cursor):
+        """Test that a cursor that is not a patient ID is a 400, not a Firestore path error."""
+        # Act
+        with pytest.raises(ValidationException) as exc_info:
+            patient_service._fetch_page(MagicMock(), page=1, page_size=20, cursor=cursor)
+
+        # Assert
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+        patient_service.db.collection.return_value.document.assert_not_called()
+
+    def test_unknown_cursor_is_rejected(self, patient_service):
+        """Test that a well-formed cursor without a document is rejected too."""
+        # Arrange
+        document = patient_service.db.collection.return_value.document
+        document.return_value.get.return_value.exists = False
+
+        # Act
+        with pytest.raises(ValidationException) as exc_info:
+            patient_service._fetch_page(
+                MagicMock(), page=1, page_size=20, cursor="7f1d7c4e-1f4b-4f0a-9a51-3c2e4c7d9b10"
+            )
+
+        # Assert
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+        document.assert_called_once_with("7f1d7c4e-1f4b-4f0a-9a51-3c2e4c7d9b10")
+
+
+@pytest.mark.unit
+class TestBulkMedicalHistory:
+    """Test suite for bulk medical history imports."""
+
+    @pytest.fixture
+    def patient_service(self):
+        """Create a patient service with a mocked Firestore client and an existing patient."""
+        with patch("app.services.patient_service_firestore.get_firestore_client", return_value=MagicMock()):
+            service = PatientServiceFirestore()
+        service._require_patient = AsyncMock()
+        return service
+
+    async def test_import_over_limit_is_rejected(self, patient_service):
+        """Test that an oversized import is refused before anything is written."""
+        # Arrange
+        items = [MedicalHistoryCreate(condition_name="Asthma")] * (MAX_BULK_HISTORY_ITEMS + 1)
+
+        # Act
+        with pytest.raises(ValidationException) as exc_info:
+            await patient_service.add_medical_history_bulk(uuid4(), items)
+
+        # Assert
+        assert exc_info.value.error_code == "TOO_MANY_ITEMS"
+        patient_service.db.batch.assert_not_called()
+
+    async def test_failed_batch_logs_committed_entries(self, patient_service, monkeypatch):
+        """Test that a partial import raises and logs the IDs that were written."""
+        # Arrange
+        monkeypatch.setattr(patient_module, "_WRITE_BATCH_SIZE", 2)
+        committed, failing = MagicMock(), MagicMock()
+        failing.commit.side_effect = RuntimeError("commit failed")
+        patient_service.db.batch.side_effect = [committed, failing]
+        items = [MedicalHistoryCreate(condition_name=f"Condition {i}") for i in range(4)]
+
+        # Act
+        with patch.object(patient_module.logger, "error") as log_error, \
+             pytest.raises(RuntimeError, match="commit failed"):
+            await patient_service.add_medical_history_bulk(uuid4(), items)
+
+        # Assert
+        extra = log_error.call_args.kwargs["extra"]
+        assert extra["failed_batches"] == [1]
+        assert len(extra["committed_ids"]) == 2
+        committed.commit.assert_called_once()
@@ -0,0 +1,69 @@
+"""
+Unit tests for SegmentationService persistence.
+"""
+
+import asyncio
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+
+from app.services import segmentation_service as segmentation_module
+from app.services.segmentation_service import SegmentationService
+from app.models.schemas import SegmentationMetadata
+
+
+@pytest.mark.unit
+class TestSegmentationPersistence:
+    """Test suite for flushing segmentations to Firestore/GCS."""
+
+    @pytest.fixture(autouse=True)
+    def clear_pending_flushes(self, monkeypatch):
+        """Give each test its own scheduled-flush registry."""
+        monkeypatch.setattr(segmentation_module, "_pending_flushes", {})
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a segmentation service with mocked Firestore and GCS."""
+        service = SegmentationService(storage_path=str(tmp_path))
+        service._db = MagicMock()
+        service._gcs_bucket = MagicMock()
+        service.segmentations_cache["seg-1"] = {
+            "metadata": SegmentationMetadata(file_id="file-1"),
+            "masks_3d": np.zeros((4, 8, 8), dtype=np.uint8),
+            "image_shape": (8, 8, 4),
+            "source_format": "nifti",
+            "dirty_slices": {1, 2},
+        }
+        return service
+
+    async def test_get_nifti_finalizes_pending_strokes_once(self, service):
+        """Serving the NIfTI folds dirty slices in under the flush lock and clears them."""
+        pending = asyncio.create_task(asyncio.sleep(60))
+        segmentation_module._pending_flushes["seg-1"] = pending
+        blob = service._gcs_bucket.blob.return_value
+        blob.exists.return_value = True
+        blob.download_to_file.side_effect = lambda buffer: buffer.write(b"nifti")
+
+        with patch.object(service, "_save_segmentation") as save:
+            first = await service.get_segmentation_nifti("seg-1")
+            second = await service.get_segmentation_nifti("seg-1")
+
+        await asyncio.sleep(0)
+        assert first == second == b"nifti"
+        assert pending.cancelled()
+        assert "seg-1" not in segmentation_module._pending_flushes
+        save.assert_called_once_with("seg-1", None)
+        assert service.segmentations_cache["seg-1"]["dirty_slices"] == set()
+
+    async def test_failed_flush_restores_dirty_slices(self, service):
+        """A GCS upload failure falls back to local disk but keeps the slices dirty."""
+        service._gcs_bucket.blob.return_value.upload_from_file.side_effect = RuntimeError("GCS unavailable")
+
+        with patch.object(service, "_save_segmentation_local") as save_local:
+            await service._debounced_flush("seg-1")
+            saved = await service.save_segmentation_async("seg-1")
+
+        assert saved is False
+        assert save_local.call_count == 2
+        assert service.segmentations_cache["seg-1"]["dirty_slices"] == {1, 2}
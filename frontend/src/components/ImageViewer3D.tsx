@@ -46,7 +46,7 @@ function VolumeRender({ volumeData, opacity }: VolumeRenderProps) {
         // Fill imageData with slice data
         for (let y = 0; y < height; y++) {
           for (let x = 0; x < width; x++) {
-            const value = volumeData.volume[z][y][x];
+            const value = volumeData.volume[(z * height + y) * width + x];
             const index = (y * width + x) * 4;
             data[index] = value;     // R
             data[index + 1] = value; // G
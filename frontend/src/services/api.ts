@@ -16,6 +16,13 @@ const api = axios.create({
   },
 });
 
+// Decode a zlib+base64 volume payload into its raw voxel buffer
+const decodeVolume = async (encoded: string): Promise<Uint8Array> => {
+  const compressed = Uint8Array.from(atob(encoded), (c) => c.charCodeAt(0));
+  const stream = new Blob([compressed]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Uint8Array(await new Response(stream).arrayBuffer());
+};
+
 // Medical Imaging API
 export const imagingAPI = {
   processImage: async (
@@ -70,7 +77,7 @@ export const imagingAPI = {
     const { data } = await api.get(`/api/v1/imaging/volume/${fileId}`, {
       params: { orientation },
     });
-    return data;
+    return { ...data, volume: await decodeVolume(data.volume) };
   },
 
   getVoxel3D: async (
@@ -62,7 +62,8 @@ export interface WindowLevelRequest {
 export type ImageOrientation = 'axial' | 'sagittal' | 'coronal';
 
 export interface VolumeData {
-  volume: number[][][];
+  /** Voxels in C order: (z, y, x) is at (z * shape[1] + y) * shape[2] + x */
+  volume: Uint8Array;
   shape: [number, number, number];
   orientation: ImageOrientation;
   metadata: ImageMetadata;